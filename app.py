@@ -16,11 +16,415 @@ Workflow:
 8. AI generates and sends personalized emails to maximize response rates
 """
 import streamlit as st
-import json
+import hashlib
+import logging
+import re
+import string
+import sys
 import time
+import numpy as np
+import orjson
 import pandas as pd
 import requests
 
+logger = logging.getLogger(__name__)
+
+# Static widget options, built once at import instead of on every rerun
+DEFAULT_JOB_TITLES = (
+    'M&A Associate', 'M&A Analyst', 'Vice President M&A', 'M&A Director',
+    'Managing Director - Investment Banking', 'Director - Investment Banking',
+    'Investment Banking Analyst', 'Investment Banking Associate',
+    'Vice President - Investment Banking'
+)
+
+CONFIDENCE_OPTIONS = {
+    "Cast Wide Net (0.25)": 0.25,
+    "Balanced (0.50)": 0.50,
+    "High Relevance (0.75)": 0.75,
+    "Very Specific (0.90)": 0.90
+}
+
+PROCESSING_OPTIONS = {
+    "Quick Scan": "Fast",
+    "Standard Search": "Balanced",
+    "Deep Search": "Thorough"
+}
+
+# Selectbox labels derived once from the option maps above
+CONFIDENCE_LABELS = tuple(CONFIDENCE_OPTIONS)
+PROCESSING_LABELS = tuple(PROCESSING_OPTIONS)
+
+# State name -> search code for geographic targeting
+US_STATES = {
+    "All States": "nationwide",
+    "New York": "NY",
+    "California": "CA",
+    "Texas": "TX",
+    "Florida": "FL",
+    "Illinois": "IL",
+    "Pennsylvania": "PA",
+    "Ohio": "OH",
+    "Georgia": "GA",
+    "North Carolina": "NC",
+    "Michigan": "MI",
+    "New Jersey": "NJ",
+    "Virginia": "VA",
+    "Washington": "WA",
+    "Arizona": "AZ",
+    "Massachusetts": "MA",
+    "Tennessee": "TN",
+    "Indiana": "IN",
+    "Maryland": "MD",
+    "Missouri": "MO",
+    "Wisconsin": "WI",
+    "Colorado": "CO",
+    "Minnesota": "MN",
+    "South Carolina": "SC",
+    "Alabama": "AL",
+    "Louisiana": "LA",
+    "Kentucky": "KY",
+    "Oregon": "OR",
+    "Oklahoma": "OK",
+    "Connecticut": "CT",
+    "Utah": "UT",
+    "Iowa": "IA",
+    "Nevada": "NV",
+    "Arkansas": "AR",
+    "Mississippi": "MS",
+    "Kansas": "KS",
+    "New Mexico": "NM",
+    "Nebraska": "NE",
+    "West Virginia": "WV",
+    "Idaho": "ID",
+    "Hawaii": "HI",
+    "New Hampshire": "NH",
+    "Maine": "ME",
+    "Montana": "MT",
+    "Rhode Island": "RI",
+    "Delaware": "DE",
+    "South Dakota": "SD",
+    "North Dakota": "ND",
+    "Alaska": "AK",
+    "Vermont": "VT",
+    "Wyoming": "WY"
+}
+
+# Financial centers get special highlighting in geographic targeting.
+# (state, checkbox label, widget key) for each financial center checkbox, in display order
+FINANCIAL_CENTER_WIDGETS = tuple(
+    (state, f"📍 {state}", f"state_{state}")
+    for state in ("New York", "California", "Illinois", "Texas", "Massachusetts", "Connecticut")
+)
+FINANCIAL_CENTERS = frozenset(state for state, _, _ in FINANCIAL_CENTER_WIDGETS)
+FINANCIAL_CENTER_CAPTIONS = {
+    "New York": "NYC: Wall Street, largest IB hub",
+    "California": "CA: SF/LA tech & entertainment M&A",
+    "Illinois": "IL: Chicago derivatives & middle market",
+    "Texas": "TX: Dallas/Houston energy M&A",
+    "Massachusetts": "MA: Boston biotech & PE hub",
+    "Connecticut": "CT: Greenwich/Stamford hedge funds"
+}
+US_STATE_NAMES = tuple(US_STATES)
+
+# Job sources offered in Step 4, as
+# (expander title, expanded by default, ((section heading or None, ((key, label, default), ...)), ...))
+JOB_SOURCE_CATEGORIES = (
+    ("🌐 Major Job Boards", True, (
+        (None, (
+            ("linkedin", "LinkedIn Jobs", True),
+            ("indeed", "Indeed", True),
+            ("glassdoor", "Glassdoor", True),
+            ("ziprecruiter", "ZipRecruiter", True),
+            ("monster", "Monster", True),
+            ("careerbuilder", "CareerBuilder", True),
+            ("simplyhired", "SimplyHired", True),
+            ("jobscom", "Jobs.com", True),
+            ("usajobs", "USAJobs (Gov)", False),
+            ("dice", "Dice (Tech)", True),
+            ("flexjobs", "FlexJobs", False),
+            ("remote", "Remote.co", False),
+        )),
+    )),
+    ("💼 Finance & Banking Specialized", True, (
+        (None, (
+            ("efinancial", "eFinancialCareers", True),
+            ("wallstjobs", "Wall Street Jobs", True),
+            ("financejobs", "FinanceJobs.com", True),
+            ("selbyjennings", "Selby Jennings", True),
+            ("robertwalters", "Robert Walters", True),
+            ("michaelpage", "Michael Page", True),
+            ("hays", "Hays Finance", True),
+            ("randstad", "Randstad Finance", True),
+            ("adecco", "Adecco Finance", True),
+            ("kforce", "Kforce Finance", True),
+            ("roberthalf", "Robert Half", True),
+            ("aerotek", "Aerotek Finance", True),
+        )),
+    )),
+    ("🏦 Investment Banking Focused", False, (
+        (None, (
+            ("ib_specific", "IBankingFAQ Jobs", True),
+            ("mergersandinquisitions", "M&I Job Board", True),
+            ("wallstreetoasis", "WSO Job Board", True),
+            ("financialservices", "FS Careers", True),
+            ("cityam", "CityAM Jobs (UK)", False),
+            ("efinancialuk", "eFC London", False),
+            ("buyside", "Buyside Jobs", True),
+            ("hedgefund", "HF Careers", True),
+            ("privateequity", "PE Jobs", True),
+            ("venturecapital", "VC Careers", True),
+            ("corporatedev", "Corp Dev Jobs", True),
+            ("restructuring", "Restructuring Jobs", True),
+        )),
+    )),
+    ("🏢 Direct Company Career Pages", False, (
+        ("Bulge Bracket Banks", (
+            ("goldman", "Goldman Sachs", True),
+            ("jpmorgan", "JP Morgan", True),
+            ("morganstanley", "Morgan Stanley", True),
+            ("bofa", "Bank of America", True),
+            ("citi", "Citigroup", True),
+            ("barclays", "Barclays", True),
+            ("credit_suisse", "Credit Suisse", True),
+            ("deutsche", "Deutsche Bank", True),
+        )),
+        ("Elite Boutiques", (
+            ("evercore", "Evercore", True),
+            ("lazard", "Lazard", True),
+            ("centerview", "Centerview", True),
+            ("moelis", "Moelis", True),
+            ("perella", "Perella Weinberg", True),
+            ("greenhill", "Greenhill", True),
+            ("rothschild", "Rothschild", True),
+            ("guggenheim", "Guggenheim", True),
+        )),
+        ("Middle Market Banks", (
+            ("jefferies", "Jefferies", True),
+            ("piper", "Piper Sandler", True),
+            ("cowen", "Cowen", True),
+            ("stifel", "Stifel", True),
+            ("harris", "Harris Williams", True),
+            ("lincoln", "Lincoln International", True),
+            ("william", "William Blair", True),
+            ("raymond", "Raymond James", True),
+        )),
+    )),
+    ("💰 Private Equity & Alternative Investments", False, (
+        ("Mega Funds", (
+            ("blackstone", "Blackstone", True),
+            ("kkr", "KKR", True),
+            ("apollo", "Apollo", True),
+            ("carlyle", "Carlyle", True),
+            ("bain", "Bain Capital", True),
+            ("tpg", "TPG", True),
+            ("warburg", "Warburg Pincus", True),
+            ("advent", "Advent", True),
+        )),
+        ("Hedge Funds", (
+            ("citadel", "Citadel", True),
+            ("bridgewater", "Bridgewater", True),
+            ("renaissance", "Renaissance", True),
+            ("twosigma", "Two Sigma", True),
+            ("millennium", "Millennium", True),
+            ("point72", "Point72", True),
+            ("de_shaw", "D.E. Shaw", True),
+            ("jane_street", "Jane Street", True),
+        )),
+    )),
+    ("🔍 Job Aggregators & Meta-Search", False, (
+        (None, (
+            ("google_jobs", "Google for Jobs", True),
+            ("bing_jobs", "Bing Jobs", True),
+            ("jooble", "Jooble", True),
+            ("jobrapido", "Jobrapido", True),
+            ("trovit", "Trovit Jobs", True),
+            ("mitula", "Mitula Jobs", True),
+            ("jobzilla", "Jobzilla", True),
+            ("jobvertise", "Jobvertise", True),
+            ("jobisland", "Job Island", True),
+            ("jobspider", "JobSpider", True),
+            ("jobbank", "Job Bank USA", True),
+            ("snagajob", "Snagajob", True),
+        )),
+    )),
+    ("🎓 University Career Centers", False, (
+        ("Ivy League & Top MBA Programs", (
+            ("harvard", "Harvard Business", True),
+            ("wharton", "Wharton", True),
+            ("columbia", "Columbia Business", True),
+            ("kellogg", "Kellogg", True),
+            ("booth", "Booth (Chicago)", True),
+            ("sloan", "Sloan (MIT)", True),
+            ("stern", "Stern (NYU)", True),
+            ("haas", "Haas (Berkeley)", True),
+            ("fuqua", "Fuqua (Duke)", True),
+            ("princeton", "Princeton", True),
+            ("yale", "Yale", True),
+            ("stanford", "Stanford", True),
+        )),
+    )),
+    ("📰 Industry Publications & Forums", False, (
+        (None, (
+            ("bloomberg_jobs", "Bloomberg Careers", True),
+            ("reuters_jobs", "Reuters Jobs", True),
+            ("wsj_jobs", "WSJ Careers", True),
+            ("ft_jobs", "Financial Times", True),
+            ("barrons", "Barron's Jobs", True),
+            ("institutional", "Institutional Investor", True),
+            ("dealbook", "DealBook Jobs", True),
+            ("pitchbook", "PitchBook Careers", True),
+            ("preqin", "Preqin Jobs", True),
+            ("mergermarket", "Mergermarket", True),
+            ("intralinks", "Intralinks Jobs", True),
+            ("refinitiv", "Refinitiv Careers", True),
+        )),
+    )),
+    ("🌍 International Sources", False, (
+        ("UK & Europe", (
+            ("totaljobs", "TotalJobs (UK)", False),
+            ("reed", "Reed (UK)", False),
+            ("jobsite", "Jobsite (UK)", False),
+            ("stepstone", "StepStone (EU)", False),
+            ("xing", "XING (DACH)", False),
+            ("viadeo", "Viadeo (France)", False),
+        )),
+        ("Asia-Pacific", (
+            ("jobsdb", "JobsDB (Asia)", False),
+            ("seek", "Seek (Australia)", False),
+            ("jobstreet", "JobStreet (SEA)", False),
+        )),
+        ("Canada", (
+            ("workopolis", "Workopolis", False),
+            ("jobbank_ca", "Job Bank Canada", False),
+            ("monster_ca", "Monster Canada", False),
+        )),
+    )),
+)
+
+JOB_SOURCE_LABELS = {
+    key: label
+    for _, _, sections in JOB_SOURCE_CATEGORIES
+    for _, sources in sections
+    for key, label, _ in sources
+}
+
+# One multiselect per section, as
+# (expander title, expanded by default, ((widget key, section heading or None, source keys, default keys), ...))
+JOB_SOURCE_PICKERS = tuple(
+    (category, expanded, tuple(
+        (
+            f"sources_{category_idx}_{section_idx}",
+            heading,
+            tuple(key for key, _, _ in sources),
+            tuple(key for key, _, default in sources if default),
+        )
+        for section_idx, (heading, sources) in enumerate(sections)
+    ))
+    for category_idx, (category, expanded, sections) in enumerate(JOB_SOURCE_CATEGORIES)
+)
+
+# Headline sources counted in the Step 4 summary metrics
+MAJOR_BOARD_KEYS = ("linkedin", "indeed", "glassdoor", "ziprecruiter", "monster")
+FINANCE_SITE_KEYS = ("efinancial", "wallstjobs", "selbyjennings", "buyside", "hedgefund")
+COMPANY_PAGE_KEYS = ("goldman", "jpmorgan", "morganstanley", "evercore", "blackstone")
+
+# Boolean masks in JOB_SOURCE_LABELS order, one row per headline category
+SOURCE_CATEGORY_MASKS = np.array([
+    np.isin(tuple(JOB_SOURCE_LABELS), keys)
+    for keys in (MAJOR_BOARD_KEYS, FINANCE_SITE_KEYS, COMPANY_PAGE_KEYS)
+])
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_source_summary(selections: tuple) -> dict:
+    """
+    Counts selected sources overall and per headline category.
+    `selections` holds one bool per source in JOB_SOURCE_LABELS order, so
+    the cache key is a small tuple instead of the whole sources dict.
+    """
+    selected = np.fromiter(selections, dtype=bool, count=len(selections))
+    major, finance, company = (SOURCE_CATEGORY_MASKS & selected).sum(axis=1).tolist()
+    return {
+        "total": int(selected.sum()),
+        "major": major,
+        "finance": finance,
+        "company": company,
+    }
+
+# Source keys selected by the Step 4 quick-select buttons
+ESSENTIAL_SOURCE_KEYS = frozenset((
+    "linkedin", "indeed", "efinancial", "goldman", "jpmorgan", "morganstanley", "bofa", "citi"
+))
+FINANCE_SOURCE_KEYS = frozenset(
+    key
+    for category, _, sections in JOB_SOURCE_CATEGORIES
+    if category in (
+        "💼 Finance & Banking Specialized",
+        "🏦 Investment Banking Focused",
+        "🏢 Direct Company Career Pages",
+        "💰 Private Equity & Alternative Investments",
+    )
+    for _, sources in sections
+    for key, _, _ in sources
+)
+ALL_SOURCE_KEYS = frozenset(JOB_SOURCE_LABELS)
+
+def apply_source_preset(preset_keys):
+    """
+    Sets every source picker to exactly the keys in `preset_keys`. Used as an
+    on_click callback, so the pickers render with the preset in the same rerun,
+    including pickers in collapsed categories.
+    """
+    source_picks = st.session_state.setdefault('_source_picks', {})
+    for _, _, pickers in JOB_SOURCE_PICKERS:
+        for widget_key, _, keys, _ in pickers:
+            picks = [key for key in keys if key in preset_keys]
+            source_picks[widget_key] = picks
+            st.session_state[widget_key] = picks
+
+# Search context options per niche, shared by every call instead of rebuilt each time
+IB_SOURCE_OPTIONS = {
+    "Investment Banking Hiring Surge": """Investment banks are aggressively hiring across all levels. Goldman Sachs, JP Morgan, and Morgan Stanley lead the charge with expanded M&A teams. Focus on technology, healthcare, and energy sectors. Compensation packages at record highs with $200K+ for analysts.""",
+    
+    "Boutique IB Growth Market": """Middle-market investment banks experiencing unprecedented growth. Firms like Evercore, Lazard, and Moelis expanding rapidly. Seeking experienced professionals for sector-focused teams. Deal flow increasing 40% year-over-year.""",
+    
+    "Regional IB Expansion": """Regional investment banks building presence outside NYC. Chicago, San Francisco, Dallas, and Miami seeing significant IB growth. Firms establishing new offices and hiring local talent. Focus on middle-market transactions.""",
+    
+    "IB Technology Transformation": """Investment banks investing heavily in technology talent. Seeking professionals with both finance and tech backgrounds. AI, blockchain, and automation driving new hiring needs. Traditional IB roles evolving with tech requirements.""",
+    
+    "Post-Pandemic IB Hiring": """Investment banking hiring rebounds strongly post-pandemic. Remote work options expanding talent pool. Work-life balance improvements attracting new talent. Diversity initiatives driving inclusive hiring practices."""
+}
+
+MA_SOURCE_OPTIONS = {
+    "M&A Advisory Demand Surge": """M&A advisory services in high demand across all sectors. Companies seeking experienced deal professionals for complex transactions. Cross-border expertise particularly valuable. Deal sizes ranging from $50M to multi-billion.""",
+    
+    "Tech M&A Specialist Need": """Technology M&A reaching record levels with AI driving consolidation. Companies need advisors who understand SaaS, AI/ML, and cybersecurity. Valuations complex, requiring specialized expertise. Deal premiums averaging 40% above market.""",
+    
+    "Healthcare M&A Expansion": """Healthcare M&A activity accelerating with biotech consolidation. Pharma companies acquiring innovative startups. Medical device sector seeing roll-up strategies. Regulatory expertise critical for successful deals.""",
+    
+    "Private Equity M&A Growth": """Private equity firms driving M&A activity with record dry powder. Platform acquisitions and add-ons creating advisor opportunities. Operational improvement focus requiring hands-on expertise. Portfolio company exits generating fees.""",
+    
+    "Middle Market M&A Boom": """Middle market M&A thriving with $10M-$500M deals proliferating. Family businesses seeking succession planning advisors. Strategic buyers competing with financial sponsors. Regional expertise valuable for local deals."""
+}
+
+GENERAL_SOURCE_OPTIONS = {
+    "Financial Services Hiring Wave": """Financial services sector experiencing broad-based hiring surge. Investment banks, private equity, and hedge funds all expanding. Technology transformation creating new role categories. Compensation reaching new highs across all levels.""",
+    
+    "Alternative Investment Growth": """Alternative investment firms building teams aggressively. Private equity, hedge funds, and family offices competing for talent. Focus on operational expertise and value creation. Carry participation becoming standard.""",
+    
+    "Fintech Disruption Hiring": """Fintech companies hiring finance professionals from traditional firms. Blockchain, digital assets, and DeFi creating new opportunities. Startup equity packages competing with bank bonuses. Innovation mindset required.""",
+    
+    "ESG Finance Expansion": """ESG and sustainable finance driving new hiring needs. Impact investing and green finance teams expanding. Traditional firms building dedicated ESG practices. Measurement and reporting expertise valuable.""",
+    
+    "Regional Finance Growth": """Financial hubs beyond NYC/SF seeing significant growth. Miami, Austin, Nashville emerging as finance centers. Cost of living advantages attracting firms and talent. Remote work enabling geographic expansion."""
+}
+
+# (keywords, options) checked in order against the lowercased topic
+SOURCE_TEXT_DISPATCH = (
+    (("investment banking", "ib"), IB_SOURCE_OPTIONS),
+    (("m&a", "mergers"), MA_SOURCE_OPTIONS),
+)
+
+@st.cache_data(ttl=3600, max_entries=128)
 def generate_source_text_options(topic):
     """
     AI-powered function to generate source text options based on a topic.
@@ -28,155 +432,111 @@ def generate_source_text_options(topic):
     """
     topic_lower = topic.lower()
     
-    if "investment banking" in topic_lower or "ib" in topic_lower:
-        return {
-            "Investment Banking Hiring Surge": """Investment banks are aggressively hiring across all levels. Goldman Sachs, JP Morgan, and Morgan Stanley lead the charge with expanded M&A teams. Focus on technology, healthcare, and energy sectors. Compensation packages at record highs with $200K+ for analysts.""",
-            
-            "Boutique IB Growth Market": """Middle-market investment banks experiencing unprecedented growth. Firms like Evercore, Lazard, and Moelis expanding rapidly. Seeking experienced professionals for sector-focused teams. Deal flow increasing 40% year-over-year.""",
-            
-            "Regional IB Expansion": """Regional investment banks building presence outside NYC. Chicago, San Francisco, Dallas, and Miami seeing significant IB growth. Firms establishing new offices and hiring local talent. Focus on middle-market transactions.""",
-            
-            "IB Technology Transformation": """Investment banks investing heavily in technology talent. Seeking professionals with both finance and tech backgrounds. AI, blockchain, and automation driving new hiring needs. Traditional IB roles evolving with tech requirements.""",
-            
-            "Post-Pandemic IB Hiring": """Investment banking hiring rebounds strongly post-pandemic. Remote work options expanding talent pool. Work-life balance improvements attracting new talent. Diversity initiatives driving inclusive hiring practices."""
-        }
-    
-    elif "m&a" in topic_lower or "mergers" in topic_lower:
-        return {
-            "M&A Advisory Demand Surge": """M&A advisory services in high demand across all sectors. Companies seeking experienced deal professionals for complex transactions. Cross-border expertise particularly valuable. Deal sizes ranging from $50M to multi-billion.""",
-            
-            "Tech M&A Specialist Need": """Technology M&A reaching record levels with AI driving consolidation. Companies need advisors who understand SaaS, AI/ML, and cybersecurity. Valuations complex, requiring specialized expertise. Deal premiums averaging 40% above market.""",
-            
-            "Healthcare M&A Expansion": """Healthcare M&A activity accelerating with biotech consolidation. Pharma companies acquiring innovative startups. Medical device sector seeing roll-up strategies. Regulatory expertise critical for successful deals.""",
-            
-            "Private Equity M&A Growth": """Private equity firms driving M&A activity with record dry powder. Platform acquisitions and add-ons creating advisor opportunities. Operational improvement focus requiring hands-on expertise. Portfolio company exits generating fees.""",
-            
-            "Middle Market M&A Boom": """Middle market M&A thriving with $10M-$500M deals proliferating. Family businesses seeking succession planning advisors. Strategic buyers competing with financial sponsors. Regional expertise valuable for local deals."""
-        }
+    for keywords, options in SOURCE_TEXT_DISPATCH:
+        if any(keyword in topic_lower for keyword in keywords):
+            return options
     
-    else:  # General finance
-        return {
-            "Financial Services Hiring Wave": """Financial services sector experiencing broad-based hiring surge. Investment banks, private equity, and hedge funds all expanding. Technology transformation creating new role categories. Compensation reaching new highs across all levels.""",
-            
-            "Alternative Investment Growth": """Alternative investment firms building teams aggressively. Private equity, hedge funds, and family offices competing for talent. Focus on operational expertise and value creation. Carry participation becoming standard.""",
-            
-            "Fintech Disruption Hiring": """Fintech companies hiring finance professionals from traditional firms. Blockchain, digital assets, and DeFi creating new opportunities. Startup equity packages competing with bank bonuses. Innovation mindset required.""",
-            
-            "ESG Finance Expansion": """ESG and sustainable finance driving new hiring needs. Impact investing and green finance teams expanding. Traditional firms building dedicated ESG practices. Measurement and reporting expertise valuable.""",
-            
-            "Regional Finance Growth": """Financial hubs beyond NYC/SF seeing significant growth. Miami, Austin, Nashville emerging as finance centers. Cost of living advantages attracting firms and talent. Remote work enabling geographic expansion."""
-        }
+    return GENERAL_SOURCE_OPTIONS  # General finance
 
-def generate_job_title_synonyms(job_titles):
-    """
-    Generates synonyms and variations for job titles to maximize search coverage.
-    """
-    synonym_mapping = {
+# Known synonyms per job title, interned once at import so the expanded
+# sets mostly hold shared string objects
+JOB_TITLE_SYNONYMS = {
+    sys.intern(title): tuple(sys.intern(synonym) for synonym in synonyms)
+    for title, synonyms in {
         # M&A Titles
-        "M&A Associate": [
+        "M&A Associate": (
             "Mergers & Acquisitions Associate", "M and A Associate", "MA Associate",
             "Corporate Development Associate", "Strategic Finance Associate",
             "Investment Banking Associate - M&A", "Deal Associate", "Transaction Associate",
             "Corp Dev Associate", "Strategic Transactions Associate"
-        ],
-        "M&A Analyst": [
+        ),
+        "M&A Analyst": (
             "Mergers & Acquisitions Analyst", "M and A Analyst", "MA Analyst",
             "Corporate Development Analyst", "Strategic Finance Analyst",
             "Investment Banking Analyst - M&A", "Deal Analyst", "Transaction Analyst",
             "M&A Advisory Analyst", "Mergers Analyst"
-        ],
-        "Vice President M&A": [
+        ),
+        "Vice President M&A": (
             "VP M&A", "Vice President Mergers & Acquisitions", "VP Mergers and Acquisitions",
             "M&A Vice President", "Corporate Development VP", "Strategic Finance VP",
             "VP - M&A", "Vice President - Mergers & Acquisitions", "SVP M&A"
-        ],
-        "M&A Director": [
+        ),
+        "M&A Director": (
             "Director M&A", "Director Mergers & Acquisitions", "M&A Managing Director",
             "Corporate Development Director", "Strategic Finance Director",
             "Director - M&A", "Senior Director M&A", "Executive Director M&A"
-        ],
+        ),
         
         # Investment Banking Titles
-        "Investment Banking Analyst": [
+        "Investment Banking Analyst": (
             "IB Analyst", "IBD Analyst", "Investment Bank Analyst", "Corporate Finance Analyst",
             "Capital Markets Analyst", "Financial Analyst - Investment Banking",
             "Analyst - Investment Banking", "Junior Investment Banker", "Banking Analyst"
-        ],
-        "Investment Banking Associate": [
+        ),
+        "Investment Banking Associate": (
             "IB Associate", "IBD Associate", "Investment Bank Associate", "Corporate Finance Associate",
             "Capital Markets Associate", "Associate - Investment Banking",
             "Senior Investment Banking Analyst", "Investment Banker", "Banking Associate"
-        ],
-        "Vice President - Investment Banking": [
+        ),
+        "Vice President - Investment Banking": (
             "VP Investment Banking", "Investment Banking VP", "IB VP", "IBD VP",
             "Vice President - IB", "VP - Investment Banking", "Senior Vice President IB",
             "Principal - Investment Banking", "Investment Banking Vice President"
-        ],
-        "Managing Director - Investment Banking": [
+        ),
+        "Managing Director - Investment Banking": (
             "MD Investment Banking", "Investment Banking MD", "IB MD", "IBD MD",
             "Managing Director - IB", "MD - Investment Banking", "Senior Managing Director",
             "Executive Director - Investment Banking", "Partner - Investment Banking"
-        ]
-    }
-    
-    expanded_titles = set(job_titles)
-    
-    for title in job_titles:
-        # Direct synonym lookup
-        if title in synonym_mapping:
-            expanded_titles.update(synonym_mapping[title])
-        
-        # Pattern-based expansion
-        title_lower = title.lower()
-        
-        # M&A variations
-        if "m&a" in title_lower:
-            expanded_titles.add(title.replace("M&A", "Mergers & Acquisitions"))
-            expanded_titles.add(title.replace("M&A", "Mergers and Acquisitions"))
-            expanded_titles.add(title.replace("M&A", "MA"))
-            expanded_titles.add(title.replace("M&A", "M and A"))
-        
-        # Investment Banking variations
-        if "investment banking" in title_lower:
-            expanded_titles.add(title.replace("Investment Banking", "IB"))
-            expanded_titles.add(title.replace("Investment Banking", "IBD"))
-            expanded_titles.add(title.replace("Investment Banking", "Corporate Finance"))
-            expanded_titles.add(title.replace("Investment Banking", "Banking"))
-    
-    return sorted(list(expanded_titles))
+        )
+    }.items()
+}
 
-def generate_email_templates(job_data, recruitment_firm_info):
+# (pattern, replacements) used to derive title variants, e.g. "M&A Analyst" -> "MA Analyst"
+TITLE_VARIANT_RULES = (
+    (re.compile(r"M&A", re.I), ("Mergers & Acquisitions", "Mergers and Acquisitions", "MA", "M and A")),
+    (re.compile(r"Investment Banking", re.I), ("IB", "IBD", "Corporate Finance", "Banking")),
+)
+
+@st.cache_data(ttl=3600, max_entries=128)
+def generate_job_title_synonyms(job_titles):
     """
-    Generates personalized email templates for each job opportunity.
-    Focuses on creating compelling subject lines and personalized content.
+    Generates synonyms and variations for job titles to maximize search coverage.
     """
-    templates = []
+    expanded = list(job_titles)
     
-    for job in job_data:
-        company = job.get('company', 'Company')
-        title = job.get('title', 'Position')
-        location = job.get('location', 'Location')
-        
-        # Generate multiple subject line options (A/B testing)
-        subject_lines = [
-            f"Top {title} candidates ready to interview - {company}",
-            f"Re: Your {title} opening - 3 qualified candidates available",
-            f"{company}'s {title} search - we have your shortlist ready",
-            f"Proven {title} talent for {company} - immediate availability",
-            f"Quick question about your {title} role"
-        ]
+    for title in job_titles:
+        # Direct synonym lookup
+        if title in JOB_TITLE_SYNONYMS:
+            expanded.extend(JOB_TITLE_SYNONYMS[title])
         
-        # Personalized email body
-        email_body = f"""Hi [Hiring Manager Name],
+        # Pattern-based expansion (M&A and Investment Banking variations)
+        for pattern, replacements in TITLE_VARIANT_RULES:
+            if pattern.search(title):
+                expanded.extend(pattern.sub(replacement, title) for replacement in replacements)
+    
+    expanded_titles = set(expanded)
+    
+    return sorted(expanded_titles)
+
+# Subject line options for A/B testing, filled per job with str.format
+SUBJECT_TEMPLATES = (
+    "Top {title} candidates ready to interview - {company}",
+    "Re: Your {title} opening - 3 qualified candidates available",
+    "{company}'s {title} search - we have your shortlist ready",
+    "Proven {title} talent for {company} - immediate availability",
+    "Quick question about your {title} role"
+)
+
+EMAIL_BODY_TEMPLATE = string.Template("""Hi [Hiring Manager Name],
 
-I noticed {company} is looking for a {title} in {location}. 
+I noticed $company is looking for a $title in $location. 
 
 We've successfully placed similar roles at [Similar Company 1] and [Similar Company 2], typically filling positions within 3-4 weeks with candidates who stay 3+ years.
 
-I have 3 pre-screened {title} candidates who:
+I have 3 pre-screened $title candidates who:
 • Have the exact experience you're looking for
 • Are actively interviewing and will move quickly
-• Are specifically interested in {company}'s [specific aspect - culture/growth/mission]
+• Are specifically interested in $company's [specific aspect - culture/growth/mission]
 
 Would you be open to a brief 10-minute call this week to discuss? I can share candidate profiles immediately if helpful.
 
@@ -187,53 +547,157 @@ Best regards,
 [Phone] | [Email]
 
 P.S. If you're not the right person for this, could you please point me to the hiring manager? Thanks!
-"""
-        
-        templates.append({
-            'job_id': job.get('id'),
-            'company': company,
-            'position': title,
-            'subject_lines': subject_lines,
-            'email_body': email_body,
-            'contact_email': job.get('contact_email', ''),
-            'personalization_notes': job.get('company_insights', '')
-        })
-    
-    return templates
+""")
 
+@st.cache_data(max_entries=1024)
+def _render_email(company, title, location):
+    """
+    Renders the subject line options and email body for one job.
+    Cached per (company, title, location) so reruns don't re-render emails
+    for jobs that were already previewed.
+    """
+    # Generate multiple subject line options (A/B testing)
+    subject_lines = [tmpl.format(title=title, company=company) for tmpl in SUBJECT_TEMPLATES]
+    
+    # Personalized email body
+    email_body = EMAIL_BODY_TEMPLATE.substitute(company=company, title=title, location=location)
+    
+    return subject_lines, email_body
+
+def _template_for_job(job):
+    """Builds the outreach template dict for a single job posting."""
+    company = job.get('company', 'Company')
+    title = job.get('title', 'Position')
+    location = job.get('location', 'Location')
+    
+    subject_lines, email_body = _render_email(company, title, location)
+    
+    return {
+        'job_id': job.get('id'),
+        'company': company,
+        'position': title,
+        'subject_lines': subject_lines,
+        'email_body': email_body,
+        'contact_email': job.get('contact_email', ''),
+        'personalization_notes': job.get('company_insights', '')
+    }
+
+def generate_email_templates(job_data, recruitment_firm_info):
+    """
+    Generates personalized email templates for each job opportunity.
+    Focuses on creating compelling subject lines and personalized content.
+    """
+    # Rendering is cached local string work, so a thread pool would only add
+    # overhead; fan _template_for_job out once personalization hits the network.
+    return [_template_for_job(job) for job in job_data]
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_email_templates(job_ids: tuple, info_digest: str, _job_data, _recruitment_firm_info):
+    """
+    generate_email_templates memoized on the job ids and a digest of the firm
+    info, so previewing an unchanged selection again doesn't rebuild every
+    template. The underscored arguments are left out of the cache key.
+    """
+    return generate_email_templates(_job_data, _recruitment_firm_info)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def count_unique_companies(job_ids: tuple, _job_data) -> int:
+    """Counts distinct companies in a job selection, memoized on its job ids."""
+    return len({job['company'] for job in _job_data})
+
+@st.cache_resource
+def get_backend_session():
+    """
+    Returns the HTTP session used to talk to the pipeline backend.
+    Built once per server process and shared across reruns and sessions,
+    so backend calls reuse pooled keep-alive connections.
+    """
+    return requests.Session()
+
+# The backend scrapes asynchronously, so an accepted run never carries jobs yet
+PIPELINE_ACCEPTED_RESULT = {
+    "status": "success",
+    "message": "Pipeline successfully triggered on the backend.",
+    "jobs": [],
+    "total_matches": 0,
+    "logs": "Backend process initiated. Check backend logs for progress."
+}
+
+# Cached triggers older than this start a fresh scrape. Persisted caches
+# ignore ttl, so run_pipeline results carry their own trigger time instead
+PIPELINE_RESULT_MAX_AGE = 24 * 60 * 60
+
+def _pipeline_error(message: str) -> dict:
+    """Builds the run_pipeline result for a failed backend call."""
+    return {
+        "status": "error",
+        "message": message,
+        "jobs": [],
+        "total_matches": 0,
+        "logs": "Error occurred while trying to communicate with the backend."
+    }
+
+def _pipeline_result_expired(result: dict) -> bool:
+    """True when a run_pipeline result was triggered more than PIPELINE_RESULT_MAX_AGE ago."""
+    return time.time() - result.get("triggered_at", 0) > PIPELINE_RESULT_MAX_AGE
+
+@st.cache_data(persist="disk", max_entries=64, show_spinner=False)
 def run_pipeline(params: dict) -> dict:
     """
     Runs the job finding pipeline with the given parameters.
     Returns job postings that match the criteria.
+
+    Results are cached per parameter set and persisted to disk, so re-running
+    an identical search (even after an app restart) doesn't trigger another
+    backend scrape within PIPELINE_RESULT_MAX_AGE. Use the sidebar's
+    "Invalidate cache" button to force one sooner.
     """
-    print(f"run_pipeline called with params: {json.dumps(params, indent=2)}")
+    logger.debug("run_pipeline called with params: %s", params)
 
     try:
-        response = requests.post("http://localhost:3001/trigger/scrape", json=params, timeout=10)
+        response = get_backend_session().post(
+            "http://localhost:3001/trigger/scrape",
+            data=orjson.dumps(params),
+            headers={"Content-Type": "application/json"},
+            timeout=10
+        )
         if response.status_code == 202:
-            return {
-                "status": "success",
-                "message": "Pipeline successfully triggered on the backend.",
-                "jobs": [],
-                "total_matches": 0,
-                "logs": "Backend process initiated. Check backend logs for progress."
-            }
-        else:
-            return {
-                "status": "error",
-                "message": f"Failed to trigger pipeline. Backend responded with status: {response.status_code}. Response: {response.text}",
-                "jobs": [],
-                "total_matches": 0,
-                "logs": "Error occurred while trying to communicate with the backend."
-            }
+            return {**PIPELINE_ACCEPTED_RESULT, "triggered_at": time.time()}
+        return _pipeline_error(
+            f"Failed to trigger pipeline. Backend responded with status: {response.status_code}. Response: {response.text}"
+        )
     except requests.exceptions.RequestException as e:
-        return {
-            "status": "error",
-            "message": f"Failed to connect to backend API. Error: {e}",
-            "jobs": [],
-            "total_matches": 0,
-            "logs": "Error occurred while trying to communicate with the backend."
-        }
+        return _pipeline_error(f"Failed to connect to backend API. Error: {e}")
+
+# Found jobs shown per results page
+JOBS_PAGE_SIZE = 25
+
+JOB_TABLE_COLUMNS = (
+    "company", "title", "location", "salary_range", "posted_date",
+    "description", "company_insights", "contact_email", "job_url"
+)
+
+def jobs_to_dataframe(jobs_by_id: dict) -> pd.DataFrame:
+    """
+    Converts the found jobs into a columnar DataFrame for display, indexed
+    by job id so a selected row maps straight back to its job dict. Built
+    once per result set and kept in st.session_state['found_jobs_df'].
+    """
+    return pd.DataFrame(list(jobs_by_id.values()), index=list(jobs_by_id), columns=list(JOB_TABLE_COLUMNS))
+
+def set_job_selection(job_ids):
+    """
+    Replaces the selected job ids in one write. Used as an on_click
+    callback; bumping the version gives the results editor a fresh key so
+    stale per-page edits don't override the bulk change.
+    """
+    st.session_state['selected_job_ids'] = set(job_ids)
+    st.session_state['job_selection_version'] = st.session_state.get('job_selection_version', 0) + 1
+
+def simulate_latency(seconds):
+    """Sleeps only when the sidebar's "Simulate latency" demo toggle is on."""
+    if st.session_state.get('_simulate_delay'):
+        time.sleep(seconds)
 
 # Initialize session state
 if 'selected_jobs_for_outreach' not in st.session_state:
@@ -245,61 +709,71 @@ st.markdown("*Find job postings and send personalized recruitment service emails
 
 # Sidebar for global controls
 st.sidebar.title("🎛️ Controls")
-run_button_pressed = st.sidebar.button('🚀 Run Pipeline', type="primary")
+
+if st.sidebar.button("🗑️ Invalidate cache", help="Force the next run to trigger a fresh backend scrape"):
+    run_pipeline.clear()
+    st.session_state.pop('_last_param_hash', None)
+
+st.sidebar.checkbox("⏳ Simulate latency", key="_simulate_delay", value=False, help="Add demo delays to generation and sending steps")
 
 # Step 1: AI-Powered Source Text Generation
 st.header('Step 1: 🤖 Define Your Niche')
 st.markdown("Enter your recruitment focus area to generate targeted search parameters")
 
-col1, col2 = st.columns([3, 1])
+@st.fragment
+def render_niche_step():
+    """
+    Renders the niche input and search context picker and returns the chosen
+    source text. Runs as a fragment so typing a niche or switching context
+    only reruns this step; the return value is picked up on full app reruns.
+    """
+    col1, col2 = st.columns([3, 1])
 
-with col1:
-    topic_input = st.text_input(
-        "Enter your niche:",
-        placeholder="e.g., investment banking, M&A, private equity",
-        help="This helps the AI understand what types of jobs to search for"
-    )
+    with col1:
+        topic_input = st.text_input(
+            "Enter your niche:",
+            placeholder="e.g., investment banking, M&A, private equity",
+            help="This helps the AI understand what types of jobs to search for"
+        )
 
-with col2:
-    generate_button = st.button("🎯 Generate", type="secondary")
-
-# Initialize source_text variable
-source_text = ""
-
-# Generate source text options based on topic
-if generate_button and topic_input:
-    with st.spinner(f"🔍 Generating search parameters for '{topic_input}'..."):
-        time.sleep(1)
-        generated_options = generate_source_text_options(topic_input)
-        st.session_state['generated_options'] = generated_options
-        st.session_state['current_topic'] = topic_input
-
-# Display generated options
-if 'generated_options' in st.session_state:
-    selected_generated = st.selectbox(
-        "Choose search context:",
-        options=list(st.session_state['generated_options'].keys()),
-        key="generated_source_select"
-    )
+    with col2:
+        generate_button = st.button("🎯 Generate", type="secondary")
+
+    # Initialize source_text variable
+    source_text = ""
+
+    # Generate source text options based on topic
+    if generate_button and topic_input:
+        with st.spinner(f"🔍 Generating search parameters for '{topic_input}'..."):
+            simulate_latency(1)
+            # Normalize so case/whitespace variants share a cache entry
+            generated_options = generate_source_text_options(topic_input.strip().lower())
+            st.session_state['generated_options'] = generated_options
+            st.session_state['current_topic'] = topic_input
+
+    # Display generated options
+    if 'generated_options' in st.session_state:
+        selected_generated = st.selectbox(
+            "Choose search context:",
+            options=list(st.session_state['generated_options'].keys()),
+            key="generated_source_select"
+        )
     
-    if selected_generated:
-        source_text = st.session_state['generated_options'][selected_generated]
-        st.success(f"✅ Search context set: '{selected_generated}'")
+        if selected_generated:
+            source_text = st.session_state['generated_options'][selected_generated]
+            st.success(f"✅ Search context set: '{selected_generated}'")
+
+    return source_text
+
+source_text = render_niche_step()
 
 # Step 2: Job Titles with Synonym Expansion
 st.header('Step 2: 🎯 Target Job Titles')
 
-default_job_titles = [
-    'M&A Associate', 'M&A Analyst', 'Vice President M&A', 'M&A Director',
-    'Managing Director - Investment Banking', 'Director - Investment Banking',
-    'Investment Banking Analyst', 'Investment Banking Associate',
-    'Vice President - Investment Banking'
-]
-
 target_job_titles = st.multiselect(
     'Select job titles to search for:', 
-    default_job_titles, 
-    default=default_job_titles[:2], 
+    DEFAULT_JOB_TITLES, 
+    default=DEFAULT_JOB_TITLES[:2], 
     key="target_job_titles_input"
 )
 
@@ -312,8 +786,8 @@ if target_job_titles:
     
     if find_synonyms_button:
         with st.spinner("Finding job title variations..."):
-            time.sleep(1)
-            expanded_titles = generate_job_title_synonyms(target_job_titles)
+            simulate_latency(1)
+            expanded_titles = generate_job_title_synonyms(tuple(target_job_titles))
             st.session_state['expanded_job_titles'] = expanded_titles
             st.session_state['original_job_titles'] = target_job_titles
     
@@ -338,523 +812,191 @@ else:
 # Step 3: Geographic Targeting
 st.header('Step 3: 🗺️ Geographic Targeting')
 
-us_states = {
-    "All States": "nationwide",
-    "New York": "NY",
-    "California": "CA", 
-    "Texas": "TX",
-    "Florida": "FL",
-    "Illinois": "IL",
-    "Pennsylvania": "PA",
-    "Ohio": "OH",
-    "Georgia": "GA",
-    "North Carolina": "NC",
-    "Michigan": "MI",
-    "New Jersey": "NJ",
-    "Virginia": "VA",
-    "Washington": "WA",
-    "Arizona": "AZ",
-    "Massachusetts": "MA",
-    "Tennessee": "TN",
-    "Indiana": "IN",
-    "Maryland": "MD",
-    "Missouri": "MO",
-    "Wisconsin": "WI",
-    "Colorado": "CO",
-    "Minnesota": "MN",
-    "South Carolina": "SC",
-    "Alabama": "AL",
-    "Louisiana": "LA",
-    "Kentucky": "KY",
-    "Oregon": "OR",
-    "Oklahoma": "OK",
-    "Connecticut": "CT",
-    "Utah": "UT",
-    "Iowa": "IA",
-    "Nevada": "NV",
-    "Arkansas": "AR",
-    "Mississippi": "MS",
-    "Kansas": "KS",
-    "New Mexico": "NM",
-    "Nebraska": "NE",
-    "West Virginia": "WV",
-    "Idaho": "ID",
-    "Hawaii": "HI",
-    "New Hampshire": "NH",
-    "Maine": "ME",
-    "Montana": "MT",
-    "Rhode Island": "RI",
-    "Delaware": "DE",
-    "South Dakota": "SD",
-    "North Dakota": "ND",
-    "Alaska": "AK",
-    "Vermont": "VT",
-    "Wyoming": "WY"
-}
-
-# Financial centers get special highlighting
-financial_centers = ["New York", "California", "Illinois", "Texas", "Massachusetts", "Connecticut"]
-
-col1, col2 = st.columns(2)
+@st.fragment
+def render_geo_step():
+    """
+    Renders the financial center and state pickers and returns the selected
+    state codes. Runs as a fragment so ticking a state only reruns this step.
+    """
+    col1, col2 = st.columns(2)
 
-with col1:
-    st.subheader("🏦 Major Financial Centers")
-    st.markdown("*Primary investment banking hubs*")
+    with col1:
+        st.subheader("🏦 Major Financial Centers")
+        st.markdown("*Primary investment banking hubs*")
     
-    # Create a list to track financial center selections
-    financial_center_selections = []
+        # Create a list to track financial center selections
+        financial_center_selections = []
     
-    for state in financial_centers:
-        if st.checkbox(f"📍 {state}", key=f"state_{state}"):
-            financial_center_selections.append(state)
+        for state, label, key in FINANCIAL_CENTER_WIDGETS:
+            if st.checkbox(label, key=key):
+                financial_center_selections.append(state)
     
-    # Add description for each financial center
-    if "New York" in financial_center_selections:
-        st.caption("NYC: Wall Street, largest IB hub")
-    if "California" in financial_center_selections:
-        st.caption("CA: SF/LA tech & entertainment M&A")
-    if "Illinois" in financial_center_selections:
-        st.caption("IL: Chicago derivatives & middle market")
-    if "Texas" in financial_center_selections:
-        st.caption("TX: Dallas/Houston energy M&A")
-    if "Massachusetts" in financial_center_selections:
-        st.caption("MA: Boston biotech & PE hub")
-    if "Connecticut" in financial_center_selections:
-        st.caption("CT: Greenwich/Stamford hedge funds")
-
-with col2:
-    st.subheader("🌎 All US States")
+        # Add description for each financial center
+        for state in financial_center_selections:
+            st.caption(FINANCIAL_CENTER_CAPTIONS[state])
+
+    with col2:
+        st.subheader("🌎 All US States")
     
-    # Default selections include financial centers if checked
-    default_selections = ["New York", "California", "Illinois"]
+        # Default selections include financial centers if checked
+        default_selections = ["New York", "California", "Illinois"]
     
-    # Add any checked financial centers to the multiselect
-    for fc in financial_center_selections:
-        if fc not in default_selections:
-            default_selections.append(fc)
+        # Add any checked financial centers to the multiselect
+        for fc in financial_center_selections:
+            if fc not in default_selections:
+                default_selections.append(fc)
     
-    selected_states = st.multiselect(
-        'Select additional states:',
-        options=list(us_states.keys()),
-        default=default_selections,
-        key="states_input"
-    )
+        selected_states = st.multiselect(
+            'Select additional states:',
+            options=US_STATE_NAMES,
+            default=default_selections,
+            key="states_input"
+        )
 
-# Combine selections (remove duplicates)
-all_selected_states = list(set(selected_states + financial_center_selections))
-target_states = [us_states[state] for state in all_selected_states if state in us_states]
+    # Combine selections (remove duplicates, keeping selection order)
+    all_selected_states = list(dict.fromkeys(selected_states + financial_center_selections))
+    target_states = [US_STATES[state] for state in all_selected_states if state in US_STATES]
 
-# Show selected states summary
-if target_states:
-    if "nationwide" in target_states:
-        st.info("🌎 Searching nationwide across all US states")
-    else:
-        # Count financial centers vs other states
-        fc_count = len([s for s in all_selected_states if s in financial_centers])
-        other_count = len(all_selected_states) - fc_count
+    # Show selected states summary
+    if target_states:
+        if "nationwide" in target_states:
+            st.info("🌎 Searching nationwide across all US states")
+        else:
+            # Split financial centers from other states in a single pass
+            fc_states, other_states = [], []
+            for state in all_selected_states:
+                (fc_states if state in FINANCIAL_CENTERS else other_states).append(state)
+            fc_count = len(fc_states)
+            other_count = len(other_states)
         
-        st.info(f"🎯 Targeting {len(target_states)} states: {fc_count} financial centers + {other_count} additional states")
+            st.info(f"🎯 Targeting {len(target_states)} states: {fc_count} financial centers + {other_count} additional states")
         
-        # Show breakdown
-        with st.expander("View selected states"):
-            col1, col2 = st.columns(2)
-            with col1:
-                st.write("**Financial Centers:**")
-                for state in all_selected_states:
-                    if state in financial_centers:
-                        st.write(f"• {state}")
-            with col2:
-                st.write("**Other States:**")
-                for state in all_selected_states:
-                    if state not in financial_centers:
-                        st.write(f"• {state}")
-
-# Step 4: Search Configuration
-st.header('Step 4: ⚙️ Search Configuration')
-
-col1, col2 = st.columns(2)
-
-with col1:
-    confidence_options = {
-        "Cast Wide Net (0.25)": 0.25,
-        "Balanced (0.50)": 0.50,
-        "High Relevance (0.75)": 0.75,
-        "Very Specific (0.90)": 0.90
-    }
-    
-    selected_confidence = st.selectbox(
-        "Relevance threshold:",
-        options=list(confidence_options.keys()),
-        index=1
-    )
-    confidence_threshold = confidence_options[selected_confidence]
+            # Show breakdown
+            with st.expander("View selected states"):
+                col1, col2 = st.columns(2)
+                # One markdown block per column instead of a widget per state
+                col1.markdown("**Financial Centers:**\n" + "".join(f"\n- {state}" for state in fc_states))
+                col2.markdown("**Other States:**\n" + "".join(f"\n- {state}" for state in other_states))
 
-with col2:
-    processing_options = {
-        "Quick Scan": "Fast",
-        "Standard Search": "Balanced", 
-        "Deep Search": "Thorough"
-    }
-    
-    selected_processing = st.selectbox(
-        "Search depth:",
-        options=list(processing_options.keys()),
-        index=1
-    )
-    processing_mode = processing_options[selected_processing]
-
-# Job Sources Configuration
-st.subheader("📍 Job Posting Sources")
-st.markdown("*Select sources to maximize job discovery - expand each category*")
+    return target_states
 
-# Initialize source tracking
-selected_sources_count = 0
-source_mapping = {}
+target_states = render_geo_step()
 
-# Major Job Boards
-with st.expander("🌐 Major Job Boards", expanded=True):
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        search_linkedin = st.checkbox("LinkedIn Jobs", value=True, key="linkedin")
-        search_indeed = st.checkbox("Indeed", value=True, key="indeed")
-        search_glassdoor = st.checkbox("Glassdoor", value=True, key="glassdoor")
-    
-    with col2:
-        search_ziprecruiter = st.checkbox("ZipRecruiter", value=True, key="ziprecruiter")
-        search_monster = st.checkbox("Monster", value=True, key="monster")
-        search_careerbuilder = st.checkbox("CareerBuilder", value=True, key="careerbuilder")
-    
-    with col3:
-        search_simplyhired = st.checkbox("SimplyHired", value=True, key="simplyhired")
-        search_jobscom = st.checkbox("Jobs.com", value=True, key="jobscom")
-        search_usajobs = st.checkbox("USAJobs (Gov)", value=False, key="usajobs")
-    
-    with col4:
-        search_dice = st.checkbox("Dice (Tech)", value=True, key="dice")
-        search_flexjobs = st.checkbox("FlexJobs", value=False, key="flexjobs")
-        search_remote = st.checkbox("Remote.co", value=False, key="remote")
-
-# Finance-Specific Job Sites
-with st.expander("💼 Finance & Banking Specialized", expanded=True):
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        search_efinancial = st.checkbox("eFinancialCareers", value=True, key="efinancial")
-        search_wallstjobs = st.checkbox("Wall Street Jobs", value=True, key="wallstjobs")
-        search_financejobs = st.checkbox("FinanceJobs.com", value=True, key="financejobs")
-    
-    with col2:
-        search_selbyjennings = st.checkbox("Selby Jennings", value=True, key="selbyjennings")
-        search_robertwalters = st.checkbox("Robert Walters", value=True, key="robertwalters")
-        search_michaelpage = st.checkbox("Michael Page", value=True, key="michaelpage")
-    
-    with col3:
-        search_hays = st.checkbox("Hays Finance", value=True, key="hays")
-        search_randstad = st.checkbox("Randstad Finance", value=True, key="randstad")
-        search_adecco = st.checkbox("Adecco Finance", value=True, key="adecco")
-    
-    with col4:
-        search_kforce = st.checkbox("Kforce Finance", value=True, key="kforce")
-        search_roberthalf = st.checkbox("Robert Half", value=True, key="roberthalf")
-        search_aerotek = st.checkbox("Aerotek Finance", value=True, key="aerotek")
+# Step 4: Search Configuration
+st.header('Step 4: ⚙️ Search Configuration')
 
-# Investment Banking Specific
-with st.expander("🏦 Investment Banking Focused", expanded=False):
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        search_ib_specific = st.checkbox("IBankingFAQ Jobs", value=True, key="ib_specific")
-        search_mergersandinquisitions = st.checkbox("M&I Job Board", value=True, key="mergersandinquisitions")
-        search_wallstreetoasis = st.checkbox("WSO Job Board", value=True, key="wallstreetoasis")
-    
-    with col2:
-        search_financialservices = st.checkbox("FS Careers", value=True, key="financialservices")
-        search_cityam = st.checkbox("CityAM Jobs (UK)", value=False, key="cityam")
-        search_efinancialuk = st.checkbox("eFC London", value=False, key="efinancialuk")
-    
-    with col3:
-        search_buyside = st.checkbox("Buyside Jobs", value=True, key="buyside")
-        search_hedgefund = st.checkbox("HF Careers", value=True, key="hedgefund")
-        search_privateequity = st.checkbox("PE Jobs", value=True, key="privateequity")
-    
-    with col4:
-        search_venturecapital = st.checkbox("VC Careers", value=True, key="venturecapital")
-        search_corporatedev = st.checkbox("Corp Dev Jobs", value=True, key="corporatedev")
-        search_restructuring = st.checkbox("Restructuring Jobs", value=True, key="restructuring")
+@st.fragment
+def render_search_config():
+    """
+    Renders the search settings and job source pickers and returns
+    (confidence_threshold, processing_mode, all_sources). Runs as a fragment
+    so source selection doesn't rerun the rest of the app; pressing Run
+    requests a full rerun so the pipeline sees every step's inputs.
+    """
+    col1, col2 = st.columns(2)
 
-# Company Career Pages
-with st.expander("🏢 Direct Company Career Pages", expanded=False):
-    
-    # Bulge Bracket
-    st.markdown("**Bulge Bracket Banks**")
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        search_goldman = st.checkbox("Goldman Sachs", value=True, key="goldman")
-        search_jpmorgan = st.checkbox("JP Morgan", value=True, key="jpmorgan")
-    with col2:
-        search_morganstanley = st.checkbox("Morgan Stanley", value=True, key="morganstanley")
-        search_bofa = st.checkbox("Bank of America", value=True, key="bofa")
-    with col3:
-        search_citi = st.checkbox("Citigroup", value=True, key="citi")
-        search_barclays = st.checkbox("Barclays", value=True, key="barclays")
-    with col4:
-        search_credit_suisse = st.checkbox("Credit Suisse", value=True, key="credit_suisse")
-        search_deutsche = st.checkbox("Deutsche Bank", value=True, key="deutsche")
-    
-    st.markdown("---")
-    
-    # Elite Boutiques
-    st.markdown("**Elite Boutiques**")
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        search_evercore = st.checkbox("Evercore", value=True, key="evercore")
-        search_lazard = st.checkbox("Lazard", value=True, key="lazard")
-    with col2:
-        search_centerview = st.checkbox("Centerview", value=True, key="centerview")
-        search_moelis = st.checkbox("Moelis", value=True, key="moelis")
-    with col3:
-        search_perella = st.checkbox("Perella Weinberg", value=True, key="perella")
-        search_greenhill = st.checkbox("Greenhill", value=True, key="greenhill")
-    with col4:
-        search_rothschild = st.checkbox("Rothschild", value=True, key="rothschild")
-        search_guggenheim = st.checkbox("Guggenheim", value=True, key="guggenheim")
-    
-    st.markdown("---")
-    
-    # Middle Market
-    st.markdown("**Middle Market Banks**")
-    col1, col2, col3, col4 = st.columns(4)
     with col1:
-        search_jefferies = st.checkbox("Jefferies", value=True, key="jefferies")
-        search_piper = st.checkbox("Piper Sandler", value=True, key="piper")
-    with col2:
-        search_cowen = st.checkbox("Cowen", value=True, key="cowen")
-        search_stifel = st.checkbox("Stifel", value=True, key="stifel")
-    with col3:
-        search_harris = st.checkbox("Harris Williams", value=True, key="harris")
-        search_lincoln = st.checkbox("Lincoln International", value=True, key="lincoln")
-    with col4:
-        search_william = st.checkbox("William Blair", value=True, key="william")
-        search_raymond = st.checkbox("Raymond James", value=True, key="raymond")
+        selected_confidence = st.selectbox(
+            "Relevance threshold:",
+            options=CONFIDENCE_LABELS,
+            index=1
+        )
+        confidence_threshold = CONFIDENCE_OPTIONS[selected_confidence]
 
-# Private Equity & Alternative Investments
-with st.expander("💰 Private Equity & Alternative Investments", expanded=False):
-    
-    # Mega Funds
-    st.markdown("**Mega Funds**")
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        search_blackstone = st.checkbox("Blackstone", value=True, key="blackstone")
-        search_kkr = st.checkbox("KKR", value=True, key="kkr")
     with col2:
-        search_apollo = st.checkbox("Apollo", value=True, key="apollo")
-        search_carlyle = st.checkbox("Carlyle", value=True, key="carlyle")
-    with col3:
-        search_bain = st.checkbox("Bain Capital", value=True, key="bain")
-        search_tpg = st.checkbox("TPG", value=True, key="tpg")
-    with col4:
-        search_warburg = st.checkbox("Warburg Pincus", value=True, key="warburg")
-        search_advent = st.checkbox("Advent", value=True, key="advent")
-    
+        selected_processing = st.selectbox(
+            "Search depth:",
+            options=PROCESSING_LABELS,
+            index=1
+        )
+        processing_mode = PROCESSING_OPTIONS[selected_processing]
+
+    # Job Sources Configuration
+    st.subheader("📍 Job Posting Sources")
+    st.markdown("*Select sources to maximize job discovery - open a category to edit it*")
+
+    # Only open categories render their pickers; the rest reuse their last picks
+    open_categories = []
+    toggle_cols = st.columns(3)
+    for category_idx, (category, expanded, _) in enumerate(JOB_SOURCE_PICKERS):
+        with toggle_cols[category_idx % len(toggle_cols)]:
+            open_categories.append(st.toggle(category, value=expanded, key=f"open_sources_{category_idx}"))
+
+    source_picks = st.session_state.setdefault('_source_picks', {})
+
+    # Batch source edits into a single rerun on submit
+    with st.form("pipeline_config", border=False):
+        all_sources = dict.fromkeys(JOB_SOURCE_LABELS, False)
+        for is_open, (category, _, pickers) in zip(open_categories, JOB_SOURCE_PICKERS):
+            if not is_open:
+                for widget_key, _, _, defaults in pickers:
+                    all_sources.update(dict.fromkeys(source_picks.get(widget_key, defaults), True))
+                continue
+
+            with st.expander(category, expanded=True):
+                for widget_key, heading, keys, defaults in pickers:
+                    # Unrendered widgets drop their state, so seed it from the saved picks
+                    if widget_key not in st.session_state:
+                        st.session_state[widget_key] = list(source_picks.get(widget_key, defaults))
+                    picked = st.multiselect(
+                        heading or category,
+                        options=keys,
+                        format_func=JOB_SOURCE_LABELS.__getitem__,
+                        key=widget_key,
+                        label_visibility="visible" if heading else "collapsed"
+                    )
+                    source_picks[widget_key] = picked
+                    all_sources.update(dict.fromkeys(picked, True))
+
+        run_button_pressed = st.form_submit_button('🚀 Run Pipeline', type="primary")
+
+    # Count selected sources by category
+    source_summary = compute_source_summary(tuple(all_sources.values()))
+    total_selected = source_summary["total"]
+
+    # Compact summary
     st.markdown("---")
-    
-    # Hedge Funds
-    st.markdown("**Hedge Funds**")
     col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        search_citadel = st.checkbox("Citadel", value=True, key="citadel")
-        search_bridgewater = st.checkbox("Bridgewater", value=True, key="bridgewater")
-    with col2:
-        search_renaissance = st.checkbox("Renaissance", value=True, key="renaissance")
-        search_twosigma = st.checkbox("Two Sigma", value=True, key="twosigma")
-    with col3:
-        search_millennium = st.checkbox("Millennium", value=True, key="millennium")
-        search_point72 = st.checkbox("Point72", value=True, key="point72")
-    with col4:
-        search_de_shaw = st.checkbox("D.E. Shaw", value=True, key="de_shaw")
-        search_jane_street = st.checkbox("Jane Street", value=True, key="jane_street")
 
-# Job Aggregators & Meta-Search
-with st.expander("🔍 Job Aggregators & Meta-Search", expanded=False):
-    col1, col2, col3, col4 = st.columns(4)
-    
     with col1:
-        search_google_jobs = st.checkbox("Google for Jobs", value=True, key="google_jobs")
-        search_bing_jobs = st.checkbox("Bing Jobs", value=True, key="bing_jobs")
-        search_jooble = st.checkbox("Jooble", value=True, key="jooble")
-    
-    with col2:
-        search_jobrapido = st.checkbox("Jobrapido", value=True, key="jobrapido")
-        search_trovit = st.checkbox("Trovit Jobs", value=True, key="trovit")
-        search_mitula = st.checkbox("Mitula Jobs", value=True, key="mitula")
-    
-    with col3:
-        search_jobzilla = st.checkbox("Jobzilla", value=True, key="jobzilla")
-        search_jobvertise = st.checkbox("Jobvertise", value=True, key="jobvertise")
-        search_jobisland = st.checkbox("Job Island", value=True, key="jobisland")
-    
-    with col4:
-        search_jobspider = st.checkbox("JobSpider", value=True, key="jobspider")
-        search_jobbank = st.checkbox("Job Bank USA", value=True, key="jobbank")
-        search_snagajob = st.checkbox("Snagajob", value=True, key="snagajob")
+        st.metric("📊 Total Sources", total_selected)
 
-# University & MBA Career Centers
-with st.expander("🎓 University Career Centers", expanded=False):
-    
-    # Ivy League
-    st.markdown("**Ivy League & Top MBA Programs**")
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        search_harvard = st.checkbox("Harvard Business", value=True, key="harvard")
-        search_wharton = st.checkbox("Wharton", value=True, key="wharton")
-        search_columbia = st.checkbox("Columbia Business", value=True, key="columbia")
-    
     with col2:
-        search_kellogg = st.checkbox("Kellogg", value=True, key="kellogg")
-        search_booth = st.checkbox("Booth (Chicago)", value=True, key="booth")
-        search_sloan = st.checkbox("Sloan (MIT)", value=True, key="sloan")
-    
-    with col3:
-        search_stern = st.checkbox("Stern (NYU)", value=True, key="stern")
-        search_haas = st.checkbox("Haas (Berkeley)", value=True, key="haas")
-        search_fuqua = st.checkbox("Fuqua (Duke)", value=True, key="fuqua")
-    
-    with col4:
-        search_princeton = st.checkbox("Princeton", value=True, key="princeton")
-        search_yale = st.checkbox("Yale", value=True, key="yale")
-        search_stanford = st.checkbox("Stanford", value=True, key="stanford")
+        st.metric("🌐 Major Boards", f"{source_summary['major']}/{len(MAJOR_BOARD_KEYS)}")
 
-# Industry Publications & Forums
-with st.expander("📰 Industry Publications & Forums", expanded=False):
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        search_bloomberg_jobs = st.checkbox("Bloomberg Careers", value=True, key="bloomberg_jobs")
-        search_reuters_jobs = st.checkbox("Reuters Jobs", value=True, key="reuters_jobs")
-        search_wsj_jobs = st.checkbox("WSJ Careers", value=True, key="wsj_jobs")
-    
-    with col2:
-        search_ft_jobs = st.checkbox("Financial Times", value=True, key="ft_jobs")
-        search_barrons = st.checkbox("Barron's Jobs", value=True, key="barrons")
-        search_institutional = st.checkbox("Institutional Investor", value=True, key="institutional")
-    
     with col3:
-        search_dealbook = st.checkbox("DealBook Jobs", value=True, key="dealbook")
-        search_pitchbook = st.checkbox("PitchBook Careers", value=True, key="pitchbook")
-        search_preqin = st.checkbox("Preqin Jobs", value=True, key="preqin")
-    
-    with col4:
-        search_mergermarket = st.checkbox("Mergermarket", value=True, key="mergermarket")
-        search_intralinks = st.checkbox("Intralinks Jobs", value=True, key="intralinks")
-        search_refinitiv = st.checkbox("Refinitiv Careers", value=True, key="refinitiv")
+        st.metric("💼 Finance Sites", f"{source_summary['finance']}/{len(FINANCE_SITE_KEYS)}")
 
-# International Sources
-with st.expander("🌍 International Sources", expanded=False):
-    
-    # UK/Europe
-    st.markdown("**UK & Europe**")
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        search_totaljobs = st.checkbox("TotalJobs (UK)", value=False, key="totaljobs")
-        search_reed = st.checkbox("Reed (UK)", value=False, key="reed")
-        search_jobsite = st.checkbox("Jobsite (UK)", value=False, key="jobsite")
-    
-    with col2:
-        search_stepstone = st.checkbox("StepStone (EU)", value=False, key="stepstone")
-        search_xing = st.checkbox("XING (DACH)", value=False, key="xing")
-        search_viadeo = st.checkbox("Viadeo (France)", value=False, key="viadeo")
-    
-    # Asia-Pacific
-    st.markdown("**Asia-Pacific**")
-    with col3:
-        search_jobsdb = st.checkbox("JobsDB (Asia)", value=False, key="jobsdb")
-        search_seek = st.checkbox("Seek (Australia)", value=False, key="seek")
-        search_jobstreet = st.checkbox("JobStreet (SEA)", value=False, key="jobstreet")
-    
-    # Canada
-    st.markdown("**Canada**")
     with col4:
-        search_workopolis = st.checkbox("Workopolis", value=False, key="workopolis")
-        search_jobbank_ca = st.checkbox("Job Bank Canada", value=False, key="jobbank_ca")
-        search_monster_ca = st.checkbox("Monster Canada", value=False, key="monster_ca")
-
-# Collect all source selections
-all_sources = {
-    # Major Job Boards
-    "linkedin": search_linkedin, "indeed": search_indeed, "glassdoor": search_glassdoor,
-    "ziprecruiter": search_ziprecruiter, "monster": search_monster, "careerbuilder": search_careerbuilder,
-    "simplyhired": search_simplyhired, "jobscom": search_jobscom, "usajobs": search_usajobs,
-    "dice": search_dice, "flexjobs": search_flexjobs, "remote": search_remote,
-    
-    # Finance Specialized
-    "efinancial": search_efinancial, "wallstjobs": search_wallstjobs, "financejobs": search_financejobs,
-    "selbyjennings": search_selbyjennings, "robertwalters": search_robertwalters, "michaelpage": search_michaelpage,
-    "hays": search_hays, "randstad": search_randstad, "adecco": search_adecco,
-    "kforce": search_kforce, "roberthalf": search_roberthalf, "aerotek": search_aerotek,
-    
-    # IB Specific
-    "ib_specific": search_ib_specific, "mergersandinquisitions": search_mergersandinquisitions,
-    "wallstreetoasis": search_wallstreetoasis, "financialservices": search_financialservices,
-    "buyside": search_buyside, "hedgefund": search_hedgefund, "privateequity": search_privateequity,
-    "venturecapital": search_venturecapital, "corporatedev": search_corporatedev,
-    
-    # Company Career Pages
-    "goldman": search_goldman, "jpmorgan": search_jpmorgan, "morganstanley": search_morganstanley,
-    "bofa": search_bofa, "evercore": search_evercore, "lazard": search_lazard,
-    "blackstone": search_blackstone, "kkr": search_kkr, "apollo": search_apollo,
-    
-    # Aggregators
-    "google_jobs": search_google_jobs, "bing_jobs": search_bing_jobs, "jooble": search_jooble,
-    
-    # Universities
-    "harvard": search_harvard, "wharton": search_wharton, "columbia": search_columbia,
-    
-    # Publications
-    "bloomberg_jobs": search_bloomberg_jobs, "reuters_jobs": search_reuters_jobs, "wsj_jobs": search_wsj_jobs
-}
-
-# Count selected sources by category
-total_selected = sum(1 for selected in all_sources.values() if selected)
-major_boards_selected = sum(1 for key in ["linkedin", "indeed", "glassdoor", "ziprecruiter", "monster"] if all_sources.get(key, False))
-finance_specialized_selected = sum(1 for key in ["efinancial", "wallstjobs", "selbyjennings", "buyside", "hedgefund"] if all_sources.get(key, False))
-company_pages_selected = sum(1 for key in ["goldman", "jpmorgan", "morganstanley", "evercore", "blackstone"] if all_sources.get(key, False))
-
-# Compact summary
-st.markdown("---")
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.metric("📊 Total Sources", total_selected)
+        st.metric("🏢 Company Pages", f"{source_summary['company']}/{len(COMPANY_PAGE_KEYS)}")
 
-with col2:
-    st.metric("🌐 Major Boards", f"{major_boards_selected}/5")
+    # Quick selection buttons (compact)
+    col1, col2, col3 = st.columns(3)
 
-with col3:
-    st.metric("💼 Finance Sites", f"{finance_specialized_selected}/5")
+    with col1:
+        st.button("✅ Select Essentials", help="LinkedIn, Indeed, eFinancial, top banks",
+                  on_click=apply_source_preset, args=(ESSENTIAL_SOURCE_KEYS,))
 
-with col4:
-    st.metric("🏢 Company Pages", f"{company_pages_selected}/5")
+    with col2:
+        st.button("🏦 Select All Finance", help="All finance-specific sources",
+                  on_click=apply_source_preset, args=(FINANCE_SOURCE_KEYS,))
 
-# Quick selection buttons (compact)
-col1, col2, col3 = st.columns(3)
+    with col3:
+        st.button("🌍 Select Everything", help="All available sources",
+                  on_click=apply_source_preset, args=(ALL_SOURCE_KEYS,))
 
-with col1:
-    if st.button("✅ Select Essentials", help="LinkedIn, Indeed, eFinancial, top banks"):
-        st.info("Essential sources selected")
+    if total_selected > 0:
+        st.success(f"✅ {total_selected} job sources configured for comprehensive search")
+    else:
+        st.warning("⚠️ Please select at least one job source")
 
-with col2:
-    if st.button("🏦 Select All Finance", help="All finance-specific sources"):
-        st.info("All finance sources selected")
+    if run_button_pressed:
+        st.session_state['run_requested'] = True
+        st.rerun()
 
-with col3:
-    if st.button("🌍 Select Everything", help="All available sources"):
-        st.info("All sources selected")
+    return confidence_threshold, processing_mode, all_sources
 
-if total_selected > 0:
-    st.success(f"✅ {total_selected} job sources configured for comprehensive search")
-else:
-    st.warning("⚠️ Please select at least one job source")
+confidence_threshold, processing_mode, all_sources = render_search_config()
 
 # Pipeline Execution
 def execute_pipeline_flow():
@@ -868,74 +1010,138 @@ def execute_pipeline_flow():
         st.error("❌ Please select job titles (Step 2)")
         return
     
+    job_sources = {key: value for key, value in all_sources.items() if value}
+    
     params = {
         "source_text": source_text,
         "target_job_titles": final_job_titles,
         "target_states": target_states,
         "confidence_threshold": confidence_threshold,
         "processing_mode": processing_mode,
-        "job_sources": {key: value for key, value in all_sources.items() if value}
+        "job_sources": job_sources,
+        "job_sources_enabled_count": len(job_sources)
     }
 
-    with st.spinner('🔄 Searching for job postings...'):
-        results = run_pipeline(params)
+    # Skip the pipeline entirely when the inputs haven't changed since the last successful run
+    param_hash = hash(orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+    submitted_at = time.time()
+    if param_hash == st.session_state.get('_last_param_hash') and not _pipeline_result_expired(st.session_state['_last_results']):
+        results = st.session_state['_last_results']
+    else:
+        with st.status('🔄 Searching for job postings...', expanded=True) as status:
+            status.write(f"Submitting search for {len(final_job_titles)} job titles to the backend...")
+            results = run_pipeline(params)
+            if results.get("status") == "success" and _pipeline_result_expired(results):
+                # Expire day-old triggers by hand, since the disk cache never does
+                run_pipeline.clear(params)
+                results = run_pipeline(params)
+            status.write(results.get('logs', ''))
+            if results.get("status") == "success":
+                status.update(label='✅ Search submitted', state="complete", expanded=False)
+            else:
+                status.update(label='❌ Search failed', state="error")
 
     if results.get("status") == "success":
-        st.success(f"✅ {results.get('message')}")
+        if results['triggered_at'] < submitted_at:
+            # Served from a cache, so no new scrape was started by this click
+            triggered_at = time.strftime('%Y-%m-%d %H:%M', time.localtime(results['triggered_at']))
+            st.info(f"♻️ This search was already submitted at {triggered_at}; reusing that backend run. Use \"Invalidate cache\" in the sidebar to scrape again now.")
+        else:
+            st.success(f"✅ {results.get('message')}")
+        
+        # Reusing the stored results brings nothing new, so keep the found
+        # jobs and the user's Step 5 selection as they are
+        if results == st.session_state.get('_last_results'):
+            return
         
         # Store results in session state
+        st.session_state['_last_param_hash'] = param_hash
+        st.session_state['_last_results'] = results
         st.session_state['pipeline_results'] = results
-        st.session_state['found_jobs'] = results.get('jobs', [])
+        # Drop duplicate postings and index by id for selection lookups
+        jobs_by_id = {job['id']: job for job in results.get('jobs', [])}
+        st.session_state['jobs_by_id'] = jobs_by_id
+        st.session_state['found_jobs'] = list(jobs_by_id.values())
+        st.session_state['found_jobs_df'] = jobs_to_dataframe(jobs_by_id)
+        st.session_state['selected_job_ids'] = set()
     else:
+        # Don't serve a failed trigger from the cache on the next run
+        run_pipeline.clear(params)
         st.error(f"❌ Pipeline failed: {results.get('message')}")
 
 # Run pipeline button
-if run_button_pressed:
+if st.session_state.pop('run_requested', False):
     execute_pipeline_flow()
 
 # Step 5: Results and Selection
-if 'found_jobs' in st.session_state and st.session_state['found_jobs']:
-    st.header('Step 5: 📊 Found Job Postings')
+@st.fragment
+def render_results():
+    """
+    Renders the found jobs table and, once jobs are picked, the outreach step.
+    Runs as a fragment so selecting jobs or previewing emails doesn't rerun
+    the search configuration above. Step 6 shares this fragment because it
+    depends on the current selection.
+    """
+    found_jobs = st.session_state.get('found_jobs')
+    if not found_jobs:
+        return
     
-    jobs_df = pd.DataFrame(st.session_state['found_jobs'])
+    st.header('Step 5: 📊 Found Job Postings')
     
-    # Select all checkbox
+    # Bulk selection runs as callbacks, before the table reads the selection
     col1, col2, col3 = st.columns([1, 1, 2])
     with col1:
-        select_all = st.checkbox("Select All Jobs", key="select_all_jobs")
+        st.button("☑️ Select All Jobs", on_click=set_job_selection, args=(tuple(st.session_state['jobs_by_id']),))
+        st.button("⬜ Deselect All", on_click=set_job_selection, args=((),))
     
     with col2:
-        st.metric("Total Jobs Found", len(jobs_df))
+        st.metric("Total Jobs Found", len(found_jobs))
     
     # Display jobs with selection
     st.subheader("🎯 Select Jobs for Outreach")
     
-    selected_jobs = []
+    # Selections are kept by job id across pages, so paging doesn't lose them
+    jobs_by_id = st.session_state['jobs_by_id']
+    selected_ids = st.session_state.setdefault('selected_job_ids', set())
+    
+    total_pages = -(-len(found_jobs) // JOBS_PAGE_SIZE)
+    page = 0
+    if total_pages > 1:
+        page = st.selectbox(
+            "Page",
+            options=range(total_pages),
+            format_func=lambda p: f"{p + 1} of {total_pages}",
+            key="found_jobs_page"
+        )
+    page_start = page * JOBS_PAGE_SIZE
+    page_df = st.session_state['found_jobs_df'].iloc[page_start:page_start + JOBS_PAGE_SIZE]
+    
+    # One editable table with a selection column instead of a widget set per job
+    edited_jobs = st.data_editor(
+        page_df.assign(selected=page_df.index.isin(selected_ids)),
+        hide_index=True,
+        use_container_width=True,
+        key=f"found_jobs_editor_{page}_{st.session_state.get('job_selection_version', 0)}",
+        column_order=("selected",) + JOB_TABLE_COLUMNS,
+        disabled=JOB_TABLE_COLUMNS,
+        column_config={
+            "selected": st.column_config.CheckboxColumn("Select", default=False),
+            "company": st.column_config.TextColumn("Company", width="medium"),
+            "title": st.column_config.TextColumn("Title", width="large"),
+            "location": st.column_config.TextColumn("Location", width="medium"),
+            "salary_range": st.column_config.TextColumn("Salary", width="small"),
+            "posted_date": st.column_config.TextColumn("Posted", width="small"),
+            "description": st.column_config.TextColumn("Description", width="large"),
+            "company_insights": st.column_config.TextColumn("Company Insights", width="large"),
+            "contact_email": st.column_config.TextColumn("Contact", width="medium"),
+            "job_url": st.column_config.LinkColumn("URL", width="small"),
+        }
+    )
     
-    for idx, job in enumerate(st.session_state['found_jobs']):
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            # Job details
-            st.markdown(f"**{job['company']}** - {job['title']}")
-            st.caption(f"📍 {job['location']} | 💰 {job['salary_range']} | 📅 Posted: {job['posted_date']}")
-            
-            with st.expander("View Details"):
-                st.write(f"**Description:** {job['description']}")
-                st.write(f"**Company Insights:** {job['company_insights']}")
-                st.write(f"**Contact:** {job['contact_email']}")
-                st.write(f"**URL:** {job['job_url']}")
-        
-        with col2:
-            # Individual selection
-            is_selected = st.checkbox(
-                "Select", 
-                value=select_all, 
-                key=f"job_select_{job['id']}"
-            )
-            
-            if is_selected:
-                selected_jobs.append(job)
+    # Only this page's rows can have changed; sort ids for stable cache keys
+    selected_ids.difference_update(edited_jobs.index)
+    selected_ids.update(edited_jobs.index[edited_jobs["selected"]])
+    selected_jobs = [jobs_by_id[job_id] for job_id in sorted(selected_ids)]
     
     # Update session state with selections
     st.session_state.selected_jobs_for_outreach = selected_jobs
@@ -988,7 +1194,12 @@ if 'found_jobs' in st.session_state and st.session_state['found_jobs']:
             }
             
             with st.spinner("Generating personalized emails..."):
-                email_templates = generate_email_templates(selected_jobs, recruitment_info)
+                email_templates = cached_email_templates(
+                    tuple(job.get('id') for job in selected_jobs),
+                    hashlib.blake2s(orjson.dumps(recruitment_info, option=orjson.OPT_SORT_KEYS)).hexdigest(),
+                    selected_jobs,
+                    recruitment_info
+                )
                 st.session_state['email_templates'] = email_templates
         
         # Display email previews
@@ -1011,32 +1222,42 @@ if 'found_jobs' in st.session_state and st.session_state['found_jobs']:
             with col2:
                 if st.button("🚀 Send All Emails", type="primary", use_container_width=True):
                     with st.spinner(f"Sending {len(selected_jobs)} personalized emails..."):
-                        time.sleep(3)  # Simulate sending
+                        simulate_latency(3)  # Simulate sending
                         st.success(f"✅ Successfully sent {len(selected_jobs)} emails!")
                         st.balloons()
                         
                         # Show summary
                         st.subheader("📊 Outreach Summary")
                         st.write(f"- **Emails Sent:** {len(selected_jobs)}")
-                        st.write(f"- **Companies Contacted:** {len(set(job['company'] for job in selected_jobs))}")
+                        st.write(f"- **Companies Contacted:** {count_unique_companies(tuple(job.get('id') for job in selected_jobs), selected_jobs)}")
                         st.write(f"- **Expected Response Rate:** 15-25% (based on similar campaigns)")
                         st.write(f"- **Follow-up Scheduled:** 3 days")
 
+render_results()
+
 # Sidebar summary
-with st.sidebar:
+@st.fragment
+def render_sidebar_summary(target_states):
+    """
+    Renders the pipeline summary. Runs as a fragment, called inside the
+    sidebar since fragments can't open st.sidebar themselves.
+    """
     st.markdown("---")
     st.subheader("📋 Pipeline Summary")
-    
+
     if 'current_topic' in st.session_state:
         st.write(f"**Niche:** {st.session_state['current_topic']}")
-    
+
     if 'expanded_job_titles' in st.session_state:
         st.write(f"**Job Titles:** {len(st.session_state.get('expanded_job_titles', []))} variations")
-    
+
     st.write(f"**States:** {len(target_states)} selected")
-    
+
     if 'found_jobs' in st.session_state:
         st.write(f"**Jobs Found:** {len(st.session_state['found_jobs'])}")
-    
+
     if 'selected_jobs_for_outreach' in st.session_state:
         st.write(f"**Selected for Outreach:** {len(st.session_state['selected_jobs_for_outreach'])}")
+
+with st.sidebar:
+    render_sidebar_summary(target_states)
@@ -6,8 +6,11 @@ import streamlit as st
 import pandas as pd
 import requests
 import json
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import time
 
 # Page config
 st.set_page_config(
@@ -35,30 +38,121 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Timestamp columns parsed to datetimes when jobs are fetched
+DATETIME_COLUMNS = ('collected_at', 'email_sent_at', 'email_opened_at', 'email_clicked_at', 'email_replied_at')
+
+# Text columns the New Jobs filters search, case-insensitively
+FILTER_COLUMNS = ('company', 'title', 'location')
+
+# Text columns held as Arrow strings, so handing them to st.data_editor /
+# st.dataframe doesn't convert Python string objects to Arrow on every render
+ARROW_TEXT_COLUMNS = ('id', 'company', 'title', 'location', 'source')
+
+# How many of the most recent sent/replied jobs the history tabs show
+RECENT_JOBS_LIMIT = 100
+
+# Rows per page in the job tables; only the visible page is sent to the browser
+JOBS_PAGE_SIZE = 50
+
 # API Functions
+@st.cache_resource
+def get_backend_session():
+    """
+    Shared HTTP session for backend calls, created once per process so
+    requests reuse pooled keep-alive connections. Idempotent requests retry
+    briefly on connection errors.
+    """
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    ))
+    return session
+
+@st.cache_resource
+def get_thread_pool():
+    """Worker pool for concurrent backend calls, shared across reruns and sessions"""
+    return ThreadPoolExecutor(max_workers=8)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_jobs(status=None):
+    """
+    Fetch jobs from the API, cached for 30 seconds so reruns (tab clicks,
+    filter keystrokes) don't refetch. Errors raise, so failures are never cached.
+    """
+    url = "http://localhost:3001/api/jobs"
+    params = {"limit": 1000}
+    if status:
+        params["email_status"] = status
+    
+    response = get_backend_session().get(url, params=params, timeout=10)
+    if response.status_code != 200:
+        raise RuntimeError(f"API Error: {response.status_code}")
+    # orjson decodes the up-to-1000-row payload several times faster than response.json()
+    df = pd.DataFrame(orjson.loads(response.content).get('jobs', []))
+    
+    # A handful of repeated statuses store compactly as a category, and Arrow
+    # backed text keeps .str work (short ids, lowercasing) vectorized
+    if 'email_status' in df.columns:
+        df['email_status'] = df['email_status'].astype('category')
+    for column in ARROW_TEXT_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('string[pyarrow]')
+    
+    # Parse timestamps once per fetch instead of on every table render
+    for column in DATETIME_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column], errors='coerce')
+    
+    # Lowercase the filterable text once per fetch rather than on every keystroke
+    for column in FILTER_COLUMNS:
+        if column in df.columns:
+            df[f"{column}_lower"] = df[column].str.lower()
+    return df
+
 def fetch_jobs_by_status(status=None):
     """Fetch jobs from the database filtered by email status"""
     try:
-        url = "http://localhost:3001/api/jobs"
-        params = {"limit": 1000}
-        if status:
-            params["email_status"] = status
-        
-        response = requests.get(url, params=params, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            return pd.DataFrame(data.get('jobs', []))
-        else:
-            st.error(f"API Error: {response.status_code}")
-            return pd.DataFrame()
+        return _get_jobs(status)
+    except RuntimeError as e:
+        st.error(str(e))
+        return pd.DataFrame()
     except Exception as e:
         st.error(f"Failed to fetch jobs: {str(e)}")
         return pd.DataFrame()
 
-def update_job_status(job_id, status):
-    """Update the email status of a job"""
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_jobs_summary():
+    """
+    Fetch status counts and database stats aggregated server side, cached like
+    _get_jobs. A backend without the summary endpoint returns None, which is
+    cached too, so reruns don't keep retrying a request that will fail.
+    """
+    response = get_backend_session().get("http://localhost:3001/api/jobs/summary", timeout=10)
+    if response.status_code != 200:
+        return None
+    return orjson.loads(response.content)
+
+def fetch_jobs_summary():
+    """Fetch {counts, total, companies, locations}, or None if the summary isn't available"""
     try:
-        response = requests.put(
+        return _get_jobs_summary()
+    except Exception:
+        return None
+
+def invalidate_jobs_cache():
+    """Drop cached job lists and counts after a change or an explicit refresh"""
+    _get_jobs.clear()
+    _get_jobs_summary.clear()
+
+def update_job_status(job_id, status, session=None):
+    """
+    Update the email status of a job. Worker threads pass in a session
+    resolved on the script thread, since cached resources need its context.
+    """
+    try:
+        response = (session or get_backend_session()).put(
             f"http://localhost:3001/api/jobs/{job_id}",
             json={"email_status": status},
             timeout=10
@@ -67,13 +161,60 @@ def update_job_status(job_id, status):
     except Exception as e:
         return {"error": str(e)}
 
-def send_test_email(job_id):
-    """Send a test email for a specific job"""
+def _bulk_route_missing(response):
+    """
+    True when the backend doesn't serve PUT /api/jobs/bulk: a 404/405, or the
+    500 an older backend's /api/jobs/:id route answers when 'bulk' fails its
+    UUID cast (the bulk route's own failures carry a different message)
+    """
+    if response.status_code in (404, 405):
+        return True
+    if response.status_code != 500:
+        return False
+    try:
+        return response.json() == {"error": "Internal server error"}
+    except ValueError:
+        return False
+
+def bulk_update_job_status(job_ids, status):
+    """Update the email status of several jobs in a single request"""
+    job_ids = list(job_ids)
     try:
-        response = requests.post(
+        session = get_backend_session()
+        response = session.put(
+            "http://localhost:3001/api/jobs/bulk",
+            json={"job_ids": job_ids, "email_status": status},
+            timeout=10
+        )
+        if _bulk_route_missing(response):
+            # Older backend without the bulk route; update per job instead
+            return _update_job_statuses_concurrently(job_ids, status, session)
+        if not response.ok:
+            return {"error": f"API Error: {response.status_code} - {response.text}"}
+        return response.json()
+    except Exception as e:
+        return {"error": str(e)}
+
+def _update_job_statuses_concurrently(job_ids, status, session):
+    """Fallback for bulk_update_job_status: per-job updates overlapped on a thread pool"""
+    responses = list(get_thread_pool().map(lambda job_id: update_job_status(job_id, status, session), job_ids))
+    results = [
+        {"id": job_id, "success": bool(result.get("success"))}
+        for job_id, result in zip(job_ids, responses)
+    ]
+    return {
+        "success": True,
+        "updated": sum(item["success"] for item in results),
+        "results": results
+    }
+
+def send_test_emails(job_ids):
+    """Send test emails for several jobs in a single outreach request"""
+    try:
+        response = get_backend_session().post(
             "http://localhost:3001/trigger/outreach",
             json={
-                "job_ids": [job_id],
+                "job_ids": list(job_ids),
                 "email_config": {
                     "firm_name": "Robertson Wright",
                     "sender_name": "Joe Robertson",
@@ -87,7 +228,7 @@ def send_test_email(job_id):
                         "subject_lines": ["Test email from Robertson Wright"],
                         "email_body": "This is a test email from the recruitment pipeline."
                     }
-                }]
+                } for job_id in job_ids]
             },
             timeout=30
         )
@@ -102,52 +243,49 @@ st.markdown("Manage your recruitment outreach pipeline with ease")
 # Top metrics
 col1, col2, col3, col4, col5 = st.columns(5)
 
-# Fetch all jobs for metrics
+# Fetch all jobs for the tabs
 all_jobs_df = fetch_jobs_by_status()
 
-if not all_jobs_df.empty:
-    with col1:
-        if 'email_status' in all_jobs_df.columns:
-            new_count = len(all_jobs_df[all_jobs_df['email_status'] == 'new'])
-        else:
-            new_count = 0
-        st.metric("📥 New Jobs", new_count)
-    
-    with col2:
-        if 'email_status' in all_jobs_df.columns:
-            queued_count = len(all_jobs_df[all_jobs_df['email_status'] == 'queued'])
-        else:
-            queued_count = 0
-        st.metric("📧 Queued", queued_count)
-    
-    with col3:
-        if 'email_status' in all_jobs_df.columns:
-            sent_count = len(all_jobs_df[all_jobs_df['email_status'] == 'sent'])
-        else:
-            sent_count = 0
-        st.metric("✉️ Sent", sent_count)
-    
-    with col4:
-        if 'email_status' in all_jobs_df.columns:
-            replied_count = len(all_jobs_df[all_jobs_df['email_status'] == 'replied'])
-        else:
-            replied_count = 0
-        st.metric("💬 Replies", replied_count)
-    
-    with col5:
-        response_rate = (replied_count / sent_count * 100) if sent_count > 0 else 0
-        st.metric("📈 Response Rate", f"{response_rate:.1f}%")
+# Metric cards only need counts, which the backend aggregates for us
+jobs_summary = fetch_jobs_summary()
+if jobs_summary is not None:
+    status_counts = jobs_summary.get('counts', {})
+elif 'email_status' in all_jobs_df.columns:
+    # One hashed pass over the column instead of a mask per status
+    status_counts = {
+        status: int(count)
+        for status, count in all_jobs_df['email_status'].value_counts().items()
+    }
 else:
-    with col1:
-        st.metric("📥 New Jobs", 0)
-    with col2:
-        st.metric("📧 Queued", 0)
-    with col3:
-        st.metric("✉️ Sent", 0)
-    with col4:
-        st.metric("💬 Replies", 0)
-    with col5:
-        st.metric("📈 Response Rate", "0.0%")
+    status_counts = {}
+
+new_count = status_counts.get('new', 0)
+queued_count = status_counts.get('queued', 0)
+sent_count = status_counts.get('sent', 0)
+replied_count = status_counts.get('replied', 0)
+
+with col1:
+    st.metric("📥 New Jobs", new_count)
+
+with col2:
+    st.metric("📧 Queued", queued_count)
+
+with col3:
+    st.metric("✉️ Sent", sent_count)
+
+with col4:
+    st.metric("💬 Replies", replied_count)
+
+with col5:
+    response_rate = (replied_count / sent_count * 100) if sent_count > 0 else 0
+    st.metric("📈 Response Rate", f"{response_rate:.1f}%")
+
+# Split jobs by status once for all four tabs
+if 'email_status' in all_jobs_df.columns:
+    jobs_by_status = dict(tuple(all_jobs_df.groupby('email_status', sort=False, observed=True)))
+else:
+    jobs_by_status = {}
+no_jobs_df = all_jobs_df.iloc[0:0]
 
 # Tab navigation
 tab1, tab2, tab3, tab4 = st.tabs([
@@ -158,6 +296,26 @@ tab1, tab2, tab3, tab4 = st.tabs([
 ])
 
 # Helper function to create interactive dataframe
+def render_page_picker(n_rows, key_prefix):
+    """Show a page picker when n_rows needs more than one page and return the visible row range"""
+    n_pages = max(1, -(-n_rows // JOBS_PAGE_SIZE))
+    page_key = f"{key_prefix}_page"
+    # Filters can shrink the table under the stored page, so clamp before the widget renders
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+    
+    page = 1
+    if n_pages > 1:
+        col1, col2 = st.columns([1, 5])
+        with col1:
+            page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key)
+    start = (page - 1) * JOBS_PAGE_SIZE
+    stop = min(start + JOBS_PAGE_SIZE, n_rows)
+    if n_pages > 1:
+        with col2:
+            st.caption(f"Showing {start + 1}–{stop} of {n_rows} jobs")
+    return page, start, stop
+
 def create_job_dataframe(df, show_select=True, key_prefix=""):
     """Create an interactive dataframe with selection capability"""
     if df.empty:
@@ -173,28 +331,32 @@ def create_job_dataframe(df, show_select=True, key_prefix=""):
     if 'email_replied_at' in df.columns:
         display_columns.append('email_replied_at')
     
+    page, start, stop = render_page_picker(len(df), key_prefix)
+    
     # Add selection column if needed
     if show_select:
-        # Reset index to ensure proper alignment
-        df_work = df.reset_index(drop=True).copy()
-        df_display = df_work[display_columns].copy()
+        # Index the jobs by their short ID (first 8 chars of the job ID) once;
+        # both the visible page and the selection lookup go through it
+        jobs_by_short_id = df.set_index(df['id'].str[:8])
+        view = jobs_by_short_id.iloc[start:stop]
         
-        # Convert datetime columns to proper format
-        if 'collected_at' in df_display.columns:
-            df_display['collected_at'] = pd.to_datetime(df_display['collected_at'], errors='coerce')
-        if 'email_sent_at' in df_display.columns:
-            df_display['email_sent_at'] = pd.to_datetime(df_display['email_sent_at'], errors='coerce')
+        # Ticks live in session state by short ID, so they survive page changes
+        selected_ids = st.session_state.setdefault(f"{key_prefix}_selected", set())
         
-        # Add job ID as verification column (show only first 8 chars)
-        df_display.insert(0, 'job_id', df_work['id'].str[:8])
-        df_display.insert(1, 'Select', False)
+        # Build the display frame for the visible page only, led by the job ID
+        # verification column and the selection column
+        df_display = pd.DataFrame({
+            'job_id': view.index,
+            'Select': view.index.isin(selected_ids),
+            **{column: view[column].array for column in display_columns}
+        })
         
         # Use data editor for selection
         edited_df = st.data_editor(
             df_display,
             hide_index=True,
             use_container_width=True,
-            key=f"{key_prefix}_editor",
+            key=f"{key_prefix}_editor_{page}",
             column_config={
                 "job_id": st.column_config.TextColumn(
                     "Job ID",
@@ -231,28 +393,22 @@ def create_job_dataframe(df, show_select=True, key_prefix=""):
             }
         )
         
-        # Get selected rows using job IDs for absolute safety
-        selected_short_ids = edited_df[edited_df['Select']]['job_id'].tolist()
-        # Match the short IDs back to full IDs
-        selected_jobs = df_work[df_work['id'].str[:8].isin(selected_short_ids)].to_dict('records')
+        # Fold this page's ticks back into the stored selection
+        selected_ids.difference_update(view.index)
+        selected_ids.update(edited_df.loc[edited_df['Select'], 'job_id'])
+        # Match the short IDs back to full jobs through the index, skipping
+        # ticks for jobs this table no longer shows (e.g. filtered out)
+        selected_jobs = jobs_by_short_id.loc[jobs_by_short_id.index.intersection(list(selected_ids))].to_dict('records')
         
-        # Debug info for verification
-        if selected_jobs:
+        # Debug info for verification, only when enabled in the sidebar
+        if selected_jobs and st.session_state.get("debug", False):
             st.write(f"**Debug:** Selected {len(selected_jobs)} jobs with IDs: {[job['id'][:8] for job in selected_jobs]}")
         
         return selected_jobs
     else:
         # Just display without selection
-        df_display = df[display_columns].copy()
-        
-        # Convert datetime columns to proper format
-        if 'collected_at' in df_display.columns:
-            df_display['collected_at'] = pd.to_datetime(df_display['collected_at'], errors='coerce')
-        if 'email_sent_at' in df_display.columns:
-            df_display['email_sent_at'] = pd.to_datetime(df_display['email_sent_at'], errors='coerce')
-        
         st.dataframe(
-            df_display,
+            df[display_columns].iloc[start:stop],
             hide_index=True,
             use_container_width=True,
             key=f"{key_prefix}_display"
@@ -276,25 +432,24 @@ with tab1:
         source_filter = st.selectbox("Filter by Source", ["All", "LinkedIn", "Indeed", "Apify"], key="new_source_filter")
     
     # Fetch new jobs
-    if not all_jobs_df.empty and 'email_status' in all_jobs_df.columns:
-        new_jobs_df = all_jobs_df[all_jobs_df['email_status'] == 'new'].copy()
-    else:
-        new_jobs_df = pd.DataFrame()
+    new_jobs_df = jobs_by_status.get('new', no_jobs_df)
     
-    # Apply filters
-    if company_filter:
-        new_jobs_df = new_jobs_df[new_jobs_df['company'].str.contains(company_filter, case=False, na=False)]
-    if title_filter:
-        new_jobs_df = new_jobs_df[new_jobs_df['title'].str.contains(title_filter, case=False, na=False)]
-    if location_filter:
-        new_jobs_df = new_jobs_df[new_jobs_df['location'].str.contains(location_filter, case=False, na=False)]
-    if source_filter != "All":
-        new_jobs_df = new_jobs_df[new_jobs_df['source'] == source_filter]
+    # Apply filters as one combined mask, so the frame is sliced once
+    filter_mask = pd.Series(True, index=new_jobs_df.index)
+    for column, needle in zip(FILTER_COLUMNS, (company_filter, title_filter, location_filter)):
+        if needle and f"{column}_lower" in new_jobs_df.columns:
+            filter_mask &= new_jobs_df[f"{column}_lower"].str.contains(needle.lower(), regex=False, na=False)
+    if source_filter != "All" and 'source' in new_jobs_df.columns:
+        # Missing sources compare as NA on Arrow strings, count them as no match
+        filter_mask &= (new_jobs_df['source'] == source_filter).fillna(False)
+    if not filter_mask.all():
+        new_jobs_df = new_jobs_df.loc[filter_mask]
     
     # Action buttons
     col1, col2, col3, col4 = st.columns([1, 1, 1, 3])
     with col1:
         if st.button("🔄 Refresh", key="refresh_new"):
+            invalidate_jobs_cache()
             st.rerun()
     
     # Display jobs
@@ -306,18 +461,24 @@ with tab1:
         
         # Show which jobs will be queued
         st.write("**Selected jobs to queue:**")
-        for job in selected_new_jobs:
-            st.write(f"• **{job['company']}** - {job['title']} ({job['location']})")
+        st.markdown("\n".join(f"- **{job['company']}** - {job['title']} ({job['location']})" for job in selected_new_jobs))
         
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             if st.button(f"📧 Queue {len(selected_new_jobs)} Jobs for Outreach", type="primary", use_container_width=True):
-                # Update status to queued
-                for job in selected_new_jobs:
-                    update_job_status(job['id'], 'queued')
-                st.success(f"✅ {len(selected_new_jobs)} jobs added to outreach queue!")
-                time.sleep(1)
-                st.rerun()
+                # Update status to queued in one request
+                result = bulk_update_job_status([job['id'] for job in selected_new_jobs], 'queued')
+                invalidate_jobs_cache()
+                if 'error' in result:
+                    st.error(f"❌ Failed to queue jobs: {result['error']}")
+                else:
+                    failed = [item['id'] for item in result.get('results', []) if not item['success']]
+                    if failed:
+                        st.toast(f"{len(failed)} jobs could not be queued: {failed}", icon="⚠️")
+                    st.session_state.pop("new_selected", None)
+                    # Toasts survive the rerun, so the confirmation needs no blocking pause
+                    st.toast(f"{result.get('updated', 0)} jobs added to outreach queue!", icon="✅")
+                    st.rerun()
 
 # Tab 2: Outreach Queue
 with tab2:
@@ -325,10 +486,7 @@ with tab2:
     st.markdown("Jobs queued for email outreach")
     
     # Fetch queued jobs
-    if not all_jobs_df.empty and 'email_status' in all_jobs_df.columns:
-        queued_jobs_df = all_jobs_df[all_jobs_df['email_status'] == 'queued'].copy()
-    else:
-        queued_jobs_df = pd.DataFrame()
+    queued_jobs_df = jobs_by_status.get('queued', no_jobs_df)
     
     if not queued_jobs_df.empty:
         # Display queued jobs
@@ -349,22 +507,18 @@ with tab2:
             
             # Show which jobs will be sent
             st.info("📧 **Sending emails to:**")
-            for job in jobs_to_send:
-                st.write(f"• **{job['company']}** - {job['title']} ({job['location']})")
+            st.markdown("\n".join(f"- **{job['company']}** - {job['title']} ({job['location']})" for job in jobs_to_send))
             
             with st.spinner(f"Sending {len(jobs_to_send)} emails..."):
-                # Send emails using the test function for now
-                for job in jobs_to_send:
-                    result = send_test_email(job['id'])
-                    if 'error' not in result:
-                        st.success(f"✅ Email sent to {job['company']}")
-                    else:
-                        st.error(f"❌ Failed to send to {job['company']}: {result['error']}")
-                
-                st.success(f"✅ Completed sending {len(jobs_to_send)} emails!")
-                st.balloons()
-                time.sleep(2)
-                st.rerun()
+                # Send emails using the test function for now, in one request
+                result = send_test_emails([job['id'] for job in jobs_to_send])
+                invalidate_jobs_cache()
+                if 'error' in result:
+                    st.error(f"❌ Failed to send emails: {result['error']}")
+                else:
+                    st.session_state.pop("queue_selected", None)
+                    st.toast(f"Completed sending {len(jobs_to_send)} emails!", icon="🎉")
+                    st.rerun()
     else:
         st.info("No jobs in the outreach queue. Select jobs from the 'New Jobs' tab to add them to the queue.")
 
@@ -374,28 +528,26 @@ with tab3:
     st.markdown("Emails sent and awaiting response")
     
     # Fetch sent jobs
-    if not all_jobs_df.empty and 'email_status' in all_jobs_df.columns:
-        sent_jobs_df = all_jobs_df[all_jobs_df['email_status'] == 'sent'].copy()
-    else:
-        sent_jobs_df = pd.DataFrame()
+    sent_jobs_df = jobs_by_status.get('sent', no_jobs_df)
     
     if not sent_jobs_df.empty:
         # Metrics
+        n_sent = len(sent_jobs_df)
+        opened_count = int(sent_jobs_df['email_opened_at'].notna().sum()) if 'email_opened_at' in sent_jobs_df else 0
+        clicked_count = int(sent_jobs_df['email_clicked_at'].notna().sum()) if 'email_clicked_at' in sent_jobs_df else 0
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Sent", len(sent_jobs_df))
+            st.metric("Total Sent", n_sent)
         with col2:
-            opened_count = len(sent_jobs_df[sent_jobs_df.get('email_opened_at', '').notna()])
             st.metric("Opened", opened_count)
         with col3:
-            clicked_count = len(sent_jobs_df[sent_jobs_df.get('email_clicked_at', '').notna()])
             st.metric("Clicked", clicked_count)
         with col4:
-            open_rate = (opened_count / len(sent_jobs_df) * 100) if len(sent_jobs_df) > 0 else 0
+            open_rate = (opened_count / n_sent * 100) if n_sent > 0 else 0
             st.metric("Open Rate", f"{open_rate:.1f}%")
         
-        # Sort by sent date (most recent first)
-        sent_jobs_df = sent_jobs_df.sort_values('email_sent_at', ascending=False)
+        # Most recent first; nlargest partially sorts rather than ordering every row
+        sent_jobs_df = sent_jobs_df.nlargest(RECENT_JOBS_LIMIT, 'email_sent_at')
         
         # Display sent jobs
         create_job_dataframe(sent_jobs_df, show_select=False, key_prefix="sent")
@@ -408,10 +560,7 @@ with tab4:
     st.markdown("Companies that have replied to your outreach")
     
     # Fetch replied jobs
-    if not all_jobs_df.empty and 'email_status' in all_jobs_df.columns:
-        replied_jobs_df = all_jobs_df[all_jobs_df['email_status'] == 'replied'].copy()
-    else:
-        replied_jobs_df = pd.DataFrame()
+    replied_jobs_df = jobs_by_status.get('replied', no_jobs_df)
     
     if not replied_jobs_df.empty:
         # Success metrics
@@ -419,14 +568,14 @@ with tab4:
         with col1:
             st.metric("Total Replies", len(replied_jobs_df))
         with col2:
-            positive_count = len(replied_jobs_df[replied_jobs_df.get('reply_sentiment', '') == 'positive'])
+            positive_count = int((replied_jobs_df['reply_sentiment'] == 'positive').sum()) if 'reply_sentiment' in replied_jobs_df else 0
             st.metric("Positive Replies", positive_count)
         with col3:
             avg_response_time = "2.3 days"  # Calculate from data
             st.metric("Avg Response Time", avg_response_time)
         
-        # Sort by reply date (most recent first)
-        replied_jobs_df = replied_jobs_df.sort_values('email_replied_at', ascending=False)
+        # Most recent first; nlargest partially sorts rather than ordering every row
+        replied_jobs_df = replied_jobs_df.nlargest(RECENT_JOBS_LIMIT, 'email_replied_at')
         
         # Display replied jobs
         create_job_dataframe(replied_jobs_df, show_select=False, key_prefix="replied")
@@ -438,11 +587,12 @@ with st.sidebar:
     st.header("⚡ Quick Actions")
     
     if st.button("🔄 Refresh All Data", use_container_width=True):
+        invalidate_jobs_cache()
         st.rerun()
     
     if st.button("🚀 Run New Scrape", use_container_width=True):
         with st.spinner("Running scraper..."):
-            response = requests.post(
+            response = get_backend_session().post(
                 "http://localhost:3001/trigger/scrape",
                 json={"location": "United States", "maxItems": 50},
                 timeout=30
@@ -454,10 +604,15 @@ with st.sidebar:
     
     st.markdown("---")
     st.subheader("📊 Database Stats")
-    if not all_jobs_df.empty:
-        st.metric("Total Jobs", len(all_jobs_df))
+    if jobs_summary is not None:
+        st.metric("Total Jobs", jobs_summary.get('total', 0))
+        st.metric("Companies", jobs_summary.get('companies', 0))
+        st.metric("Locations", jobs_summary.get('locations', 0))
+    elif not all_jobs_df.empty:
+        st.metric("Total Jobs", sum(status_counts.values()))
         st.metric("Companies", all_jobs_df['company'].nunique())
         st.metric("Locations", all_jobs_df['location'].nunique())
     
     st.markdown("---")
+    st.checkbox("🐞 Debug", key="debug", help="Show selected job IDs under each table")
     st.caption("Last updated: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S")) 
\ No newline at end of file
@@ -147,23 +147,23 @@ function setupRoutes() {
         target_states: req.body.target_states,
         confidence_threshold: req.body.confidence_threshold,
         processing_mode: req.body.processing_mode,
-        job_sources: req.body.job_sources
+        job_sources: req.body.job_sources,
+        job_sources_enabled_count: req.body.job_sources_enabled_count
       };
       
-      // Run scraping and return results immediately
-      const results = await runScraping(options);
+      // Run scraping in the background so callers (e.g. the Streamlit UI)
+      // aren't blocked for the duration of every actor run
+      runScraping(options)
+        .then(results => logger.info('Manual scraping via API completed.', { results }))
+        .catch(error => logger.error('Error in manual scraping via API.', { error: error.message }));
       
-      logger.info('Manual scraping via API completed.', { results });
-      return res.json({ 
-        success: true,
-        message: 'Smart scraping completed successfully',
-        results,
-        strategy: results.strategy,
-        rateLimitInfo: results.rateLimitInfo,
+      return res.status(202).json({ 
+        status: 'accepted',
+        message: 'Smart scraping process initiated.',
         timestamp: new Date().toISOString()
       });
     } catch (error) {
-      logger.error('Error in manual scraping via API', { error: error.message });
+      logger.error('Error triggering manual scraping via API', { error: error.message });
       return res.status(500).json({ 
         success: false,
         error: error.message,
@@ -346,6 +346,67 @@ function setupRoutes() {
     }
   });
 
+  app.get('/api/jobs/summary', async (req, res) => {
+    if (!logger) {
+      return res.status(503).json({ error: 'Logger not available' });
+    }
+    
+    try {
+      const db = require('./src/db');
+      const [statusResult, distinctResult] = await Promise.all([
+        db.query('SELECT email_status, COUNT(*)::int AS count FROM jobs GROUP BY email_status'),
+        db.query('SELECT COUNT(DISTINCT company)::int AS companies, COUNT(DISTINCT location)::int AS locations FROM jobs')
+      ]);
+      
+      const counts = {};
+      let total = 0;
+      for (const row of statusResult.rows) {
+        counts[row.email_status] = row.count;
+        total += row.count;
+      }
+      const { companies, locations } = distinctResult.rows[0];
+      
+      res.json({ counts, total, companies, locations });
+    } catch (error) {
+      logger.error('Error fetching job summary', { error: error.message });
+      res.status(500).json({ error: 'Internal server error' });
+    }
+  });
+
+  // Registered before /api/jobs/:id so "bulk" isn't taken as a job id
+  app.put('/api/jobs/bulk', async (req, res) => {
+    if (!logger) {
+      return res.status(503).json({ error: 'Logger not available' });
+    }
+    
+    try {
+      const db = require('./src/db');
+      const { job_ids, email_status } = req.body;
+      
+      if (!Array.isArray(job_ids) || job_ids.length === 0) {
+        return res.status(400).json({ error: 'job_ids must be a non-empty array' });
+      }
+      if (!email_status) {
+        return res.status(400).json({ error: 'email_status is required' });
+      }
+      
+      const query = 'UPDATE jobs SET email_status = $1, updated_at = NOW() WHERE id = ANY($2) RETURNING id';
+      const result = await db.query(query, [email_status, job_ids]);
+      const updatedIds = new Set(result.rows.map(row => String(row.id)));
+      
+      res.json({
+        success: true,
+        updated: result.rows.length,
+        results: job_ids.map(id => ({ id, success: updatedIds.has(String(id)) }))
+      });
+    } catch (error) {
+      logger.error('Error bulk updating jobs', { error: error.message });
+      // Distinct from the generic message so clients can tell a failed bulk
+      // update from an older backend routing /bulk to /api/jobs/:id
+      res.status(500).json({ error: 'Bulk update failed' });
+    }
+  });
+
   app.put('/api/jobs/:id', async (req, res) => {
     if (!logger) {
       return res.status(503).json({ error: 'Logger not available' });
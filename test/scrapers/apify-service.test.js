@@ -222,6 +222,25 @@ describe('ApifyService', () => {
       ]);
     });
 
+    it('should run actors concurrently and keep results in config order', async () => {
+      let resolveFirst;
+      mockActorRunnerInstance.run
+        .mockImplementationOnce(() => new Promise(resolve => { resolveFirst = resolve; }))
+        .mockResolvedValueOnce([{ id: 2, data: 'profile_result' }]);
+
+      const pending = apifyService.runActors();
+      await new Promise(resolve => setImmediate(resolve));
+      // Second actor is started while the first is still running
+      expect(mockActorRunnerInstance.run).toHaveBeenCalledTimes(2);
+
+      resolveFirst([{ id: 1, data: 'google_result' }]);
+      const results = await pending;
+      expect(results).toEqual([
+        { id: 1, data: 'google_result' },
+        { id: 2, data: 'profile_result' },
+      ]);
+    });
+
     it('should return empty array if an actor returns no items', async () => {
         mockActorRunnerInstance.run
             .mockResolvedValueOnce([]) // First actor returns no items